@@ -47,6 +47,7 @@ else:
 # User data directory
 USER_DATA_DIR = os.path.join(os.path.expanduser("~"), "Videos", "NeoRecorder")
 SETTINGS_FILE = os.path.join(USER_DATA_DIR, "settings.json")
+ENCODER_CACHE_FILE = os.path.join(USER_DATA_DIR, "encoders.json")
 SCREENSHOTS_DIR = os.path.join(USER_DATA_DIR, "Screenshots")
 
 # Default Settings
@@ -1,6 +1,7 @@
 
 import json
 import os
+import queue
 import threading
 import time
 import customtkinter as ctk
@@ -20,15 +21,11 @@ from gui.studio_presenter import (
     format_source_kind,
 )
 from gui.widgets import MixerStrip, ScenePreview, VUMeter
-from gui.overlay import RegionOverlay
-from gui.recording_widget import RecordingWidget
-from gui.tray import SystemTray
-from gui.quick_overlay import QuickOverlay
 from utils.display_manager import get_display_manager
 from utils.notifications import show_error_notification, show_recording_complete, show_simple_notification
 from utils.hotkeys import get_hotkey_manager
 from utils.screenshot import get_screenshot_capture
-from utils.logger import get_logger
+from utils.logger import get_logger, stop_listeners
 
 
 STUDIO_BG = "#09131B"
@@ -42,6 +39,10 @@ STUDIO_ACCENT = "#27C1F4"
 STUDIO_WARN = "#F26D3D"
 STUDIO_GO = "#1FA971"
 
+# Callbacks posted from worker threads run on the Tk thread in batches at this interval
+UI_QUEUE_POLL_MS = 50
+UI_QUEUE_BATCH = 50
+
 class SettingsWindow(ctk.CTkToplevel):
     def __init__(self, parent):
         super().__init__(parent)
@@ -316,6 +317,10 @@ class NeoRecorderApp(ctk.CTk):
             
         super().__init__()
 
+        # Worker threads never touch Tk directly, they post callbacks here
+        self._ui_queue = queue.SimpleQueue()
+        self.after(UI_QUEUE_POLL_MS, self._drain_ui_queue)
+
         self.title(APP_NAME)
         self.geometry("1480x860")
         self.configure(fg_color=STUDIO_BG)
@@ -418,11 +423,28 @@ class NeoRecorderApp(ctk.CTk):
     def on_recording_warning(self, message):
         """Handle recording warning from backend"""
         from utils.notifications import show_warning_notification
-        self.after(0, lambda: show_warning_notification("Note", message))
+        self._post_ui(lambda: show_warning_notification("Note", message))
 
     def on_recording_error(self, error):
         """Handle recording error from backend"""
-        self.after(0, lambda: self._handle_recording_error_ui(error))
+        self._post_ui(lambda: self._handle_recording_error_ui(error))
+
+    def _post_ui(self, callback):
+        """Run callback on the Tk thread; safe to call from any thread"""
+        self._ui_queue.put(callback)
+
+    def _drain_ui_queue(self):
+        """Run callbacks posted by worker threads"""
+        for _ in range(UI_QUEUE_BATCH):
+            try:
+                callback = self._ui_queue.get_nowait()
+            except queue.Empty:
+                break
+            try:
+                callback()
+            except Exception as e:
+                self._logger.error(f"UI callback error: {e}")
+        self.after(UI_QUEUE_POLL_MS, self._drain_ui_queue)
         
     def _handle_recording_error_ui(self, error):
         # Stop UI state
@@ -445,10 +467,11 @@ class NeoRecorderApp(ctk.CTk):
     def _init_tray(self):
         """Initialize system tray"""
         try:
+            from gui.tray import SystemTray
             self.tray = SystemTray(
-                on_show=self._show_from_tray,
-                on_quick_capture=self._open_quick_overlay,
-                on_quit=self._quit_app
+                on_show=self._show_from_tray_threadsafe,
+                on_quick_capture=self._open_quick_overlay_threadsafe,
+                on_quit=lambda: self._post_ui(self._quit_app)
             )
             self.tray.start()
         except Exception as e:
@@ -470,10 +493,10 @@ class NeoRecorderApp(ctk.CTk):
             self._logger.error(f"Failed to register hotkeys: {e}")
 
     def _open_quick_overlay_threadsafe(self):
-        self.after(0, self._open_quick_overlay)
+        self._post_ui(self._open_quick_overlay)
     
     def _show_from_tray_threadsafe(self):
-        self.after(0, self._show_from_tray)
+        self._post_ui(self._show_from_tray)
 
     def _load_lang(self, lang):
         path = os.path.join(LANG_DIR, f"{lang}.json")
@@ -1096,13 +1119,13 @@ class NeoRecorderApp(ctk.CTk):
             
             # 3. Update UI
             if ffmpeg_names:
-                self.after(0, lambda: self._update_audio_ui(pyaudio_devices, ffmpeg_names))
+                self._post_ui(lambda: self._update_audio_ui(pyaudio_devices, ffmpeg_names))
             elif pyaudio_devices:
                  # Fallback if FFmpeg listing failed
                  names = [d['name'] for d in pyaudio_devices]
-                 self.after(0, lambda: self._update_audio_ui(pyaudio_devices, names))
+                 self._post_ui(lambda: self._update_audio_ui(pyaudio_devices, names))
             else:
-                 self.after(0, lambda: self._update_audio_ui([], []))
+                 self._post_ui(lambda: self._update_audio_ui([], []))
                  
         except Exception as e:
             self._logger.error(f"Audio device load error: {e}")
@@ -1310,11 +1333,11 @@ class NeoRecorderApp(ctk.CTk):
             if not result:
                 # Failed synchronously
                 self.recorder.is_recording = False
-                self.after(0, lambda: self.on_recording_error("Failed to start recording process"))
+                self.on_recording_error("Failed to start recording process")
                 
         except Exception as e:
             self.recorder.is_recording = False
-            self.after(0, lambda: self.on_recording_error(f"Startup error: {e}"))
+            self.on_recording_error(f"Startup error: {e}")
 
     def _create_recording_request(self):
         self._sync_active_scene_video_source()
@@ -1499,7 +1522,8 @@ class NeoRecorderApp(ctk.CTk):
                 return
         self._cleanup()
         self.destroy()
-        import os
+        # os._exit skips atexit: write out queued log records, shutdown logging included
+        stop_listeners()
         os._exit(0)
     
     def _cleanup(self):
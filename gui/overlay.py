@@ -3,9 +3,10 @@ Region Overlay for NeoRecorder.
 Wrapper around universal RegionSelector for backwards compatibility.
 """
 
+import tkinter as tk
 from typing import Callable, Tuple
-from utils.region_selector import RegionSelector
 from config import settings
+from utils.region_selector import RegionSelector
 
 
 class RegionOverlay:
@@ -50,5 +51,5 @@ class RegionOverlay:
         """Destroy overlay"""
         try:
             self._selector.destroy()
-        except:
+        except tk.TclError:
             pass
@@ -3,21 +3,66 @@ Quick Capture Overlay for NeoRecorder.
 Toolbar + dimmed screen + region selection.
 """
 
-import customtkinter as ctk
+import ctypes
 import tkinter as tk
+from ctypes import wintypes
+from functools import lru_cache
 from typing import Callable, Optional, Tuple
-import ctypes
-from PIL import ImageGrab, ImageTk, ImageEnhance
 from config import NEON_BLUE, settings
 from utils.display_manager import get_display_manager
+from utils.region_selector import (
+    FALLBACK_ALPHA,
+    FOCUS_RETRY_MS,
+    SIZE_LABEL_MARGIN,
+    DimMask,
+    background_photo,
+    format_size_label,
+    grab_virtual_screen_async,
+)
 
 # Windows constants
 WDA_EXCLUDEFROMCAPTURE = 0x00000011
 
+# Toolbar layout: (name, glyph, font, bbox, hover color, text color)
+TOOLBAR_SIZE = (180, 50)
+TOOLBAR_BG = "#1A1A1A"
+TOOLBAR_FRAME_COLOR = "#2D2D2D"
+TOOLBAR_BUTTONS = (
+    ("screenshot", "📷", ("Segoe UI Emoji", 18), (14, 7, 54, 43), "#00C8D4", "white"),
+    ("record", "🎬", ("Segoe UI Emoji", 18), (58, 7, 98, 43), "#444444", "white"),
+    ("close", "✕", ("Arial", 14), (136, 7, 172, 43), "#FF4444", "#888888"),
+)
+MODE_COLORS = {"screenshot": NEON_BLUE, "record": "#FF4444"}
+
+# Selection follows the pointer at roughly one redraw per display frame (~60 Hz)
+POINTER_POLL_MS = 16
+
+# Toolbar drags move the window at most once per frame
+TOOLBAR_DRAG_MS = 16
+
+# How often the UI checks whether the background capture has finished
+CAPTURE_POLL_MS = 5
+
+
+@lru_cache(maxsize=1)
+def _display_affinity_api():
+    """GetParent/SetWindowDisplayAffinity with HWND-sized prototypes, resolved once"""
+    user32 = ctypes.windll.user32
+    get_parent = user32.GetParent
+    get_parent.argtypes = [wintypes.HWND]
+    get_parent.restype = wintypes.HWND
+    set_display_affinity = user32.SetWindowDisplayAffinity
+    set_display_affinity.argtypes = [wintypes.HWND, wintypes.DWORD]
+    set_display_affinity.restype = wintypes.BOOL
+    return get_parent, set_display_affinity
+
 
 class QuickOverlay:
     """Quick capture: toolbar + dimmed screen + selection"""
     
+    # Toolbar window, canvas and button ids, hidden between overlays and reused
+    _toolbar_cache = None
+    
     def __init__(
         self, 
         master,
@@ -45,30 +90,30 @@ class QuickOverlay:
         # Settings
         self.dim_screen = settings.get("overlay_dim_screen", True)
         
-        # Take screenshot
+        # Take screenshot on the capture thread, windows stay hidden until it lands
         self.screenshot = None
         self.bg_image = None
-        try:
-            self.screenshot = self._grab_background()
-            if self.dim_screen:
-                enhancer = ImageEnhance.Brightness(self.screenshot)
-                self.screenshot = enhancer.enhance(0.4)
-        except:
-            pass
+        self._capture = grab_virtual_screen_async()
         
         # Selection state
         self.start_x = None
         self.start_y = None
         self.rect_id = None
         self.size_label_id = None
+        self._poll_id = None
+        self._last_cur = None
+        self._last_wh = None
+        self._last_label_pos = None
         
         # Create windows
         self._create_selection_window()
         self._create_toolbar()
+        self._check_capture()
     
     def _create_selection_window(self):
         """Create fullscreen selection overlay"""
         self.selection_win = tk.Toplevel(self.master)
+        self.selection_win.withdraw()
         self.selection_win.overrideredirect(True)
         self.selection_win.geometry(self._virtual_geometry())
         self.selection_win.attributes("-topmost", True)
@@ -85,109 +130,196 @@ class QuickOverlay:
         )
         self.canvas.pack(fill="both", expand=True)
         
-        # Background
-        if self.screenshot:
-            self.bg_image = ImageTk.PhotoImage(self.screenshot)
-            self.canvas.create_image(0, 0, anchor="nw", image=self.bg_image, tags="bg")
+        # Dimming outside the selection
+        self.dim_mask = DimMask(self.canvas, self.screen_width, self.screen_height) if self.dim_screen else None
+        self._create_selection_items()
         
         # Bindings
         self.canvas.bind("<ButtonPress-1>", self._on_press)
-        self.canvas.bind("<B1-Motion>", self._on_drag)
         self.canvas.bind("<ButtonRelease-1>", self._on_release)
-        self.selection_win.bind("<Escape>", lambda e: self._close())
+        self.selection_win.bind("<Escape>", self._on_escape)
+        
+        self.selection_win.after_idle(self._focus_selection)
+    
+    def _check_capture(self):
+        """Show the overlay once the background capture has finished"""
+        if self._closed:
+            return
+        if not self._capture.done():
+            self.selection_win.after(CAPTURE_POLL_MS, self._check_capture)
+            return
+        try:
+            self.screenshot = self._capture.result()
+        except Exception as e:
+            print(f"Screenshot grab failed: {e}")
+        self._capture = None
         
-        self.selection_win.focus_force()
+        # Background
+        if self.screenshot:
+            self.bg_image = background_photo(self.screenshot)
+            self.canvas.create_image(0, 0, anchor="nw", image=self.bg_image, tags="bg")
+            self.canvas.tag_lower("bg")
+        else:
+            self.selection_win.attributes("-alpha", FALLBACK_ALPHA)
+        
+        self.selection_win.deiconify()
+        self.toolbar.deiconify()
+        self.toolbar.lift()
+        # Tk creates the toolbar's outer frame window on first map: exclude it once shown
+        self.toolbar.after_idle(self._set_exclusion)
+    
+    def _focus_selection(self):
+        """Focus selection window once mapped, so ESC works without a click"""
+        if self._closed:
+            return
+        try:
+            if not self.selection_win.winfo_ismapped():
+                self.selection_win.after(FOCUS_RETRY_MS, self._focus_selection)
+                return
+            self.selection_win.focus_force()
+        except tk.TclError:
+            pass
     
     def _create_toolbar(self):
-        """Create floating toolbar using CTk for better appearance"""
-        self.toolbar = ctk.CTkToplevel(self.master)
-        self.toolbar.overrideredirect(True)
-        self.toolbar.attributes("-topmost", True)
-        self.toolbar.configure(fg_color="#1A1A1A")
+        """Show the floating toolbar, building it on first use"""
+        if not self._reuse_toolbar():
+            self._build_toolbar()
         
         # Position
-        toolbar_width = 180
-        toolbar_height = 50
+        toolbar_width, toolbar_height = TOOLBAR_SIZE
         x = self.screen_left + (self.screen_width - toolbar_width) // 2
         y = self.screen_top + 30
         self.toolbar.geometry(f"{toolbar_width}x{toolbar_height}{self._axis(x)}{self._axis(y)}")
         self._set_toolbar_rect(x, y, toolbar_width, toolbar_height)
         
-        # Exclude from capture
-        self.toolbar.after(10, self._set_exclusion)
+        self._hovered_button = None
+        self._drag_x = None
+        self._drag_y = None
+        self._geom_pending = None
+        self._geom_id = None
+        self._button_commands = {
+            "screenshot": self._mode_screenshot,
+            "record": self._mode_record,
+            "close": self._close,
+        }
+        self._refresh_buttons()
+        
+        # Click, hover and drag bindings (rebinding replaces the previous overlay's handlers)
+        self.toolbar_canvas.bind("<ButtonPress-1>", self._on_toolbar_press)
+        self.toolbar_canvas.bind("<B1-Motion>", self._do_drag)
+        self.toolbar_canvas.bind("<Motion>", self._on_toolbar_hover)
+        self.toolbar_canvas.bind("<Leave>", self._on_toolbar_leave)
+        self.toolbar.bind("<Escape>", self._on_escape)
+        
+        # Keep toolbar above the selection window, re-lift only when something covers it
+        self.toolbar.bind("<Visibility>", self._on_toolbar_visibility)
+        self.selection_win.bind("<FocusIn>", self._lift_toolbar)
+        self.toolbar.lift()
+
+    def _reuse_toolbar(self):
+        """Take over the toolbar hidden by a previous overlay, returns False if there is none"""
+        cached = QuickOverlay._toolbar_cache
+        if cached is None:
+            return False
+        try:
+            if not cached[0].winfo_exists():
+                return False
+        except tk.TclError:
+            return False
+        self.toolbar, self.toolbar_canvas, self._button_ids = cached
+        return True
+
+    def _build_toolbar(self):
+        """Create the toolbar window, drawn on a single canvas and kept for later overlays"""
+        self.toolbar = tk.Toplevel(self.master)
+        self.toolbar.withdraw()
+        self.toolbar.overrideredirect(True)
+        self.toolbar.attributes("-topmost", True)
+        self.toolbar.configure(bg=TOOLBAR_BG)
         
-        # Frame
-        self.frame = ctk.CTkFrame(
+        # Frame, buttons and hit-testing all live on one canvas
+        toolbar_width, toolbar_height = TOOLBAR_SIZE
+        self.toolbar_canvas = tk.Canvas(
             self.toolbar,
-            fg_color="#2D2D2D",
-            corner_radius=12,
-            border_width=1,
-            border_color="#444444"
+            width=toolbar_width,
+            height=toolbar_height,
+            bg=TOOLBAR_BG,
+            highlightthickness=0
         )
-        self.frame.pack(fill="both", expand=True, padx=2, pady=2)
-        
-        # Buttons container
-        self.btn_frame = ctk.CTkFrame(self.frame, fg_color="transparent")
-        self.btn_frame.pack(side="left", padx=10, pady=5)
-        
-        # Screenshot button
-        self.screenshot_btn = ctk.CTkButton(
-            self.btn_frame,
-            text="📷",
-            width=40,
-            height=36,
-            font=("Segoe UI Emoji", 18),
-            fg_color=NEON_BLUE,
-            hover_color="#00C8D4",
-            corner_radius=8,
-            command=self._mode_screenshot
-        )
-        self.screenshot_btn.pack(side="left", padx=2)
-        
-        # Record button
-        self.record_btn = ctk.CTkButton(
-            self.btn_frame,
-            text="🎬",
-            width=40,
-            height=36,
-            font=("Segoe UI Emoji", 18),
-            fg_color="transparent",
-            hover_color="#444444",
-            corner_radius=8,
-            command=self._mode_record
+        self.toolbar_canvas.pack(fill="both", expand=True)
+        self._rounded_rect(
+            self.toolbar_canvas,
+            2, 2, toolbar_width - 2, toolbar_height - 2, 12,
+            fill=TOOLBAR_FRAME_COLOR,
+            outline="#444444"
         )
-        self.record_btn.pack(side="left", padx=2)
         
-        # Close button
-        self.close_btn = ctk.CTkButton(
-            self.frame,
-            text="✕",
-            width=36,
-            height=36,
-            font=("Arial", 14),
-            fg_color="transparent",
-            hover_color="#FF4444",
-            text_color="#888888",
-            corner_radius=8,
-            command=self._close
+        self._button_ids = {}
+        for name, glyph, font, bbox, _hover_color, text_color in TOOLBAR_BUTTONS:
+            x1, y1, x2, y2 = bbox
+            self._button_ids[name] = self._rounded_rect(
+                self.toolbar_canvas, x1, y1, x2, y2, 8,
+                fill=TOOLBAR_FRAME_COLOR,
+                outline=""
+            )
+            self.toolbar_canvas.create_text(
+                (x1 + x2) // 2, (y1 + y2) // 2,
+                text=glyph,
+                font=font,
+                fill=text_color
+            )
+        QuickOverlay._toolbar_cache = (self.toolbar, self.toolbar_canvas, self._button_ids)
+
+    @staticmethod
+    def _rounded_rect(canvas, x1, y1, x2, y2, radius, **kwargs):
+        """Draw a rounded rectangle as a smoothed polygon"""
+        points = (
+            x1 + radius, y1, x2 - radius, y1, x2, y1, x2, y1 + radius,
+            x2, y2 - radius, x2, y2, x2 - radius, y2, x1 + radius, y2,
+            x1, y2, x1, y2 - radius, x1, y1 + radius, x1, y1,
         )
-        self.close_btn.pack(side="right", padx=5)
-        
-        # Drag binding
-        self.frame.bind("<ButtonPress-1>", self._start_drag)
-        self.frame.bind("<B1-Motion>", self._do_drag)
-        self.toolbar.bind("<Escape>", lambda e: self._close())
-        
-        # Keep toolbar lifted
-        self.toolbar.lift()
-        self.toolbar.after(100, self._keep_lifted)
+        return canvas.create_polygon(points, smooth=True, **kwargs)
 
     @staticmethod
-    def _grab_background():
-        try:
-            return ImageGrab.grab(all_screens=True)
-        except TypeError:
-            return ImageGrab.grab()
+    def _toolbar_button_at(x, y):
+        """Return the toolbar button name under (x, y), if any"""
+        for name, _glyph, _font, (x1, y1, x2, y2), _hover_color, _text_color in TOOLBAR_BUTTONS:
+            if x1 <= x <= x2 and y1 <= y <= y2:
+                return name
+        return None
+
+    def _refresh_buttons(self):
+        """Recolor toolbar buttons for current mode and hover state"""
+        for name, _glyph, _font, _bbox, hover_color, _text_color in TOOLBAR_BUTTONS:
+            if name == self._hovered_button:
+                fill = hover_color
+            elif name == self.current_mode:
+                fill = MODE_COLORS[name]
+            else:
+                fill = TOOLBAR_FRAME_COLOR
+            self.toolbar_canvas.itemconfig(self._button_ids[name], fill=fill)
+
+    def _on_toolbar_press(self, event):
+        """Toolbar clicked - run button command or start dragging"""
+        name = self._toolbar_button_at(event.x, event.y)
+        if name is None:
+            self._start_drag(event)
+            return
+        self._drag_x = None
+        self._button_commands[name]()
+
+    def _on_toolbar_hover(self, event):
+        """Highlight the button under the pointer"""
+        name = self._toolbar_button_at(event.x, event.y)
+        if name != self._hovered_button:
+            self._hovered_button = name
+            self._refresh_buttons()
+
+    def _on_toolbar_leave(self, _event=None):
+        """Pointer left the toolbar"""
+        if self._hovered_button is not None:
+            self._hovered_button = None
+            self._refresh_buttons()
 
     def _virtual_geometry(self):
         return f"{self.screen_width}x{self.screen_height}{self._axis(self.screen_left)}{self._axis(self.screen_top)}"
@@ -201,78 +333,133 @@ class QuickOverlay:
         local_y = y - self.screen_top
         self.toolbar_rect = (local_x, local_y, local_x + width, local_y + height)
     
-    def _set_exclusion(self):
+    def _set_exclusion(self) -> bool:
         """Exclude toolbar from capture"""
         try:
-            hwnd = ctypes.windll.user32.GetParent(self.toolbar.winfo_id())
-            ctypes.windll.user32.SetWindowDisplayAffinity(hwnd, WDA_EXCLUDEFROMCAPTURE)
-        except:
-            pass
+            get_parent, set_display_affinity = _display_affinity_api()
+            # winfo_id() is Tk's client window; affinity applies to its frame
+            child = self.toolbar.winfo_id()
+            hwnd = get_parent(child)
+            if hwnd and set_display_affinity(hwnd, WDA_EXCLUDEFROMCAPTURE):
+                return True
+            if set_display_affinity(child, WDA_EXCLUDEFROMCAPTURE):
+                return True
+            print("Toolbar capture exclusion failed: SetWindowDisplayAffinity refused the window")
+        except (OSError, AttributeError) as e:
+            print(f"Toolbar capture exclusion failed: {e}")
+        return False
     
-    def _keep_lifted(self):
-        """Keep toolbar on top"""
-        if not self._closed:
-            try:
-                self.toolbar.lift()
-                self.toolbar.after(100, self._keep_lifted)
-            except:
-                pass
+    def _on_toolbar_visibility(self, event):
+        """Toolbar got covered - bring it back on top"""
+        if event.state != "VisibilityUnobscured":
+            self._lift_toolbar()
+    
+    def _lift_toolbar(self, _event=None):
+        """Raise toolbar above the selection window"""
+        if self._closed:
+            return
+        try:
+            self.toolbar.lift()
+        except tk.TclError:
+            pass
     
     def _mode_screenshot(self):
         """Set screenshot mode"""
         self.current_mode = "screenshot"
-        self.screenshot_btn.configure(fg_color=NEON_BLUE)
-        self.record_btn.configure(fg_color="transparent")
+        self._refresh_buttons()
     
     def _mode_record(self):
         """Set record mode"""
         self.current_mode = "record"
-        self.screenshot_btn.configure(fg_color="transparent")
-        self.record_btn.configure(fg_color="#FF4444")
+        self._refresh_buttons()
     
     def _is_on_toolbar(self, x, y):
         """Check if click is on toolbar"""
         tx1, ty1, tx2, ty2 = self.toolbar_rect
         return tx1 <= x <= tx2 and ty1 <= y <= ty2
     
-    def _on_press(self, event):
-        """Mouse pressed"""
-        # Check if on toolbar area
-        if self._is_on_toolbar(event.x, event.y):
-            return
-        
-        self._selecting = True
-        self.start_x = event.x
-        self.start_y = event.y
-        
-        # Create rectangle
+    def _create_selection_items(self):
+        """Create the selection rectangle and size label once, hidden until a press"""
         self.rect_id = self.canvas.create_rectangle(
-            self.start_x, self.start_y,
-            self.start_x, self.start_y,
+            0, 0, 0, 0,
             outline="#00F2FF",
             width=2,
+            state="hidden",
             tags="selection"
         )
-        
-        # Size label
         self.size_label_id = self.canvas.create_text(
-            self.start_x + 10, self.start_y - 20,
-            text="0 × 0",
+            0, 0,
+            text=format_size_label(0, 0),
             fill="#00F2FF",
             font=("Consolas", 12),
             anchor="nw",
+            state="hidden",
             tags="selection"
         )
     
-    def _on_drag(self, event):
-        """Mouse drag"""
-        if not self._selecting or self.rect_id is None:
+    def _hide_selection(self):
+        """Hide selection items so they can be reused by the next press"""
+        self.canvas.itemconfig(self.rect_id, state="hidden")
+        self.canvas.itemconfig(self.size_label_id, state="hidden")
+    
+    def _on_press(self, event):
+        """Mouse pressed"""
+        # Check if on toolbar area
+        if self._is_on_toolbar(event.x, event.y):
             return
         
-        cur_x = event.x
-        cur_y = event.y
+        self._selecting = True
+        self.start_x = event.x
+        self.start_y = event.y
+        
+        # Show the pre-created selection items at the press point
+        self.canvas.coords(self.rect_id, self.start_x, self.start_y, self.start_x, self.start_y)
+        self.canvas.coords(self.size_label_id, self.start_x + 10, self.start_y - 20)
+        self.canvas.itemconfig(self.rect_id, state="normal")
+        self.canvas.itemconfig(self.size_label_id, text=format_size_label(0, 0), state="normal")
+        self._last_cur = (self.start_x, self.start_y)
+        self._last_wh = (0, 0)
+        self._last_label_pos = (self.start_x + 10, self.start_y - 20)
+        self._schedule_poll()
+    
+    def _schedule_poll(self):
+        """Schedule the next pointer poll"""
+        self._cancel_poll()
+        self._poll_id = self.selection_win.after(POINTER_POLL_MS, self._poll_pointer)
+    
+    def _poll_pointer(self):
+        """Follow the pointer at a fixed cadence while selecting"""
+        self._poll_id = None
+        if self._closed or not self._selecting:
+            return
+        
+        pointer_x, pointer_y = self.selection_win.winfo_pointerxy()
+        if self._update_selection(pointer_x - self.screen_left, pointer_y - self.screen_top):
+            # Flush this tick's item changes as a single repaint
+            self.canvas.update_idletasks()
+        self._schedule_poll()
+    
+    def _cancel_poll(self):
+        """Stop following the pointer"""
+        if self._poll_id is not None:
+            try:
+                self.selection_win.after_cancel(self._poll_id)
+            except tk.TclError:
+                pass
+            self._poll_id = None
+    
+    def _update_selection(self, cur_x, cur_y):
+        """Redraw selection rectangle and size label, returns True if anything changed"""
+        if (cur_x, cur_y) == self._last_cur:
+            return False
+        self._last_cur = (cur_x, cur_y)
         
         self.canvas.coords(self.rect_id, self.start_x, self.start_y, cur_x, cur_y)
+        if self.dim_mask:
+            self.dim_mask.update(
+                min(cur_x, self.start_x), min(cur_y, self.start_y),
+                max(cur_x, self.start_x), max(cur_y, self.start_y)
+            )
         
         w = abs(cur_x - self.start_x)
         h = abs(cur_y - self.start_y)
@@ -281,9 +468,17 @@ class QuickOverlay:
         label_y = min(cur_y, self.start_y) - 25
         if label_y < 10:
             label_y = max(cur_y, self.start_y) + 10
-        
-        self.canvas.coords(self.size_label_id, label_x, label_y)
-        self.canvas.itemconfig(self.size_label_id, text=f"{w} × {h}")
+        # Keep the label on screen near the right/bottom edges
+        label_x = min(label_x, self.screen_width - SIZE_LABEL_MARGIN[0])
+        label_y = min(label_y, self.screen_height - SIZE_LABEL_MARGIN[1])
+        
+        if (label_x, label_y) != self._last_label_pos:
+            self._last_label_pos = (label_x, label_y)
+            self.canvas.coords(self.size_label_id, label_x, label_y)
+        if (w, h) != self._last_wh:
+            self._last_wh = (w, h)
+            self.canvas.itemconfig(self.size_label_id, text=format_size_label(w, h))
+        return True
     
     def _on_release(self, event):
         """Mouse released"""
@@ -291,6 +486,7 @@ class QuickOverlay:
             return
         
         self._selecting = False
+        self._cancel_poll()
         
         if self.start_x is None:
             return
@@ -307,6 +503,7 @@ class QuickOverlay:
             self._closed = True
             rect = self._to_absolute_rect(x1, y1, x2, y2)
             self._cleanup()
+            self._flush_master()
             
             if self.current_mode == "screenshot":
                 self.on_screenshot(rect)
@@ -316,11 +513,18 @@ class QuickOverlay:
             if self.on_close:
                 self.on_close()
         else:
-            self.canvas.delete("selection")
+            self._hide_selection()
+            if self.dim_mask:
+                self.dim_mask.clear()
             self.start_x = None
             self.start_y = None
-            self.rect_id = None
-            self.size_label_id = None
+
+    def _flush_master(self):
+        """Let Tk unmap the destroyed overlay before the capture callback runs"""
+        try:
+            self.master.update_idletasks()
+        except tk.TclError:
+            pass
 
     def _to_absolute_rect(self, x1, y1, x2, y2):
         return (
@@ -330,6 +534,10 @@ class QuickOverlay:
             y2 + self.screen_top,
         )
     
+    def _on_escape(self, _event=None):
+        """ESC pressed - close overlay"""
+        self._close()
+    
     def _close(self):
         """Close overlay"""
         if self._closed:
@@ -340,29 +548,46 @@ class QuickOverlay:
             self.on_close()
     
     def _cleanup(self):
-        """Destroy windows"""
+        """Destroy the selection window and hide the toolbar for the next overlay"""
+        self._cancel_poll()
+        if self._geom_id is not None:
+            try:
+                self.toolbar.after_cancel(self._geom_id)
+            except tk.TclError:
+                pass
+            self._geom_id = None
         try:
             self.selection_win.destroy()
-        except:
+        except tk.TclError:
             pass
         try:
-            self.toolbar.destroy()
-        except:
+            self.toolbar.withdraw()
+        except tk.TclError:
             pass
     
     def _start_drag(self, event):
-        self._drag_x = event.x
-        self._drag_y = event.y
+        # Pointer offset from the toolbar origin, read once per drag
+        self._drag_x = event.x_root - self.toolbar.winfo_x()
+        self._drag_y = event.y_root - self.toolbar.winfo_y()
     
     def _do_drag(self, event):
-        x = self.toolbar.winfo_x() + (event.x - self._drag_x)
-        y = self.toolbar.winfo_y() + (event.y - self._drag_y)
+        """Queue toolbar move for the next frame"""
+        if self._drag_x is None:
+            return
+        self._geom_pending = (event.x_root - self._drag_x, event.y_root - self._drag_y)
+        if self._geom_id is None:
+            self._geom_id = self.toolbar.after(TOOLBAR_DRAG_MS, self._apply_geometry)
+    
+    def _apply_geometry(self):
+        """Move toolbar to the latest dragged position"""
+        self._geom_id = None
+        if self._geom_pending is None or self._closed:
+            return
+        x, y = self._geom_pending
+        self._geom_pending = None
         self.toolbar.geometry(f"{self._axis(x)}{self._axis(y)}")
-        # Update rect
-        self.toolbar.update_idletasks()
-        w = self.toolbar.winfo_width()
-        h = self.toolbar.winfo_height()
-        self._set_toolbar_rect(x, y, w, h)
+        # Toolbar size is fixed, no need to ask Tk for it
+        self._set_toolbar_rect(x, y, *TOOLBAR_SIZE)
     
     def destroy(self):
         self._close()
@@ -8,11 +8,51 @@ Recording Widget v1.3.0 - Floating overlay showing recording status.
 import customtkinter as ctk
 import time
 import ctypes
+from ctypes import wintypes
+from functools import lru_cache
 from typing import Callable, Optional
 from config import NEON_BLUE, BG_COLOR
 
 # Windows Constants for exclusion from capture
 WDA_EXCLUDEFROMCAPTURE = 0x00000011
+GA_ROOT = 2
+
+# Timer wakes just after each displayed second ticks over
+TIMER_SLACK_MS = 5
+
+# Delay between capture exclusion attempts while the window is not mapped yet
+EXCLUSION_RETRY_MS = 50
+# Refusals from SetWindowDisplayAffinity on the mapped window before giving up
+EXCLUSION_ATTEMPTS = 3
+
+
+# Label templates, filled with % so each redraw is a single format call
+FMT_MMSS = "%02d:%02d"
+FMT_HMMSS = "%d:%02d:%02d"
+FMT_FPS = "FPS: %.0f"
+FMT_BITRATE = "Bitrate: %s"
+FMT_DROPPED = "Dropped: %d"
+
+
+@lru_cache(maxsize=1)
+def _capture_exclusion_api():
+    """GetAncestor/SetWindowDisplayAffinity with HWND-sized prototypes, resolved once"""
+    user32 = ctypes.windll.user32
+    get_ancestor = user32.GetAncestor
+    get_ancestor.argtypes = [wintypes.HWND, wintypes.UINT]
+    get_ancestor.restype = wintypes.HWND
+    set_display_affinity = user32.SetWindowDisplayAffinity
+    set_display_affinity.argtypes = [wintypes.HWND, wintypes.DWORD]
+    set_display_affinity.restype = wintypes.BOOL
+    return get_ancestor, set_display_affinity
+
+
+def format_elapsed(seconds: int) -> str:
+    """Timer text: MM:SS, or H:MM:SS from the first hour"""
+    hours, remainder = divmod(seconds, 3600)
+    if hours:
+        return FMT_HMMSS % (hours, *divmod(remainder, 60))
+    return FMT_MMSS % divmod(remainder, 60)
 
 
 class RecordingWidget(ctk.CTkToplevel):
@@ -25,11 +65,19 @@ class RecordingWidget(ctk.CTkToplevel):
         self.get_elapsed = get_elapsed
         self.get_progress = get_progress  # Function to get RecordingProgress
         
-        # State - MUST be initialized BEFORE setup_ui() because _animate_indicator uses them
+        # State
         self.is_paused = False
         self._pause_flash = False
+        self._anim_id = None
         self._update_id = None
         self._progress_id = None
+        self._move_id = None
+        self._move_pending = None
+        self._exclusion_id = None
+        self._exclusion_attempts = 0
+        self._last_timer_secs = None
+        self._last_progress = None  # (fps, bitrate, dropped) last rendered
+        self._shown = {}  # widget -> options last passed to configure()
         
         # Window setup
         self.overrideredirect(True)
@@ -37,8 +85,8 @@ class RecordingWidget(ctk.CTkToplevel):
         self.geometry("280x70+100+100")
         self.configure(fg_color="#1A1A1A")
         
-        # Hide from capture
-        self.set_exclusion()
+        # Hide from capture once Tk has created the real frame window
+        self._exclusion_id = self.after_idle(self._apply_exclusion)
         
         self.setup_ui()
         
@@ -50,14 +98,32 @@ class RecordingWidget(ctk.CTkToplevel):
         self.update_timer()
         self.update_progress()
 
-    def set_exclusion(self):
+    def set_exclusion(self) -> bool:
         """Exclude window from screen capture (Windows 10 2004+)"""
-        # try:
-        #     hwnd = ctypes.windll.user32.GetParent(self.winfo_id())
-        #     ctypes.windll.user32.SetWindowDisplayAffinity(hwnd, WDA_EXCLUDEFROMCAPTURE)
-        # except Exception as e:
-        #     print(f"Capture exclusion failed: {e}")
-        pass
+        try:
+            get_ancestor, set_display_affinity = _capture_exclusion_api()
+            # winfo_id() is Tk's client window; affinity applies to the top-level
+            child = self.winfo_id()
+            hwnd = get_ancestor(child, GA_ROOT)
+            if hwnd and set_display_affinity(hwnd, WDA_EXCLUDEFROMCAPTURE):
+                return True
+            if set_display_affinity(child, WDA_EXCLUDEFROMCAPTURE):
+                return True
+            print("Capture exclusion failed: SetWindowDisplayAffinity refused the window")
+        except (OSError, AttributeError) as e:
+            print(f"Capture exclusion failed: {e}")
+        return False
+
+    def _apply_exclusion(self):
+        """Exclude from capture once mapped; before the first map winfo_id() has no real top-level"""
+        self._exclusion_id = None
+        if self.winfo_ismapped():
+            if self.set_exclusion():
+                return
+            self._exclusion_attempts += 1
+            if self._exclusion_attempts >= EXCLUSION_ATTEMPTS:
+                return
+        self._exclusion_id = self.after(EXCLUSION_RETRY_MS, self._apply_exclusion)
 
     def setup_ui(self):
         self.frame = ctk.CTkFrame(
@@ -146,23 +212,22 @@ class RecordingWidget(ctk.CTkToplevel):
             text_color="#FF6666"
         )
         self.dropped_label.pack(side="right", padx=5)
-        
-        # Start indicator animation
-        self._animate_indicator()
 
     def _animate_indicator(self):
-        """Pulsing recording indicator"""
-        if not self.winfo_exists():
+        """Blink the indicator while paused; recording shows a static red dot"""
+        self._anim_id = None
+        if not self.winfo_exists() or not self.is_paused:
             return
         
-        if self.is_paused:
-            self.rec_indicator.configure(text_color="#888888")
-            self._pause_flash = not self._pause_flash
-            self.rec_indicator.configure(text="●" if self._pause_flash else "○")
-        else:
-            self.rec_indicator.configure(text="●", text_color="#FF3333")
-        
-        self.after(500, self._animate_indicator)
+        self._pause_flash = not self._pause_flash
+        self._set_options(self.rec_indicator, text="●" if self._pause_flash else "○", text_color="#888888")
+        self._anim_id = self.after(500, self._animate_indicator)
+
+    def _stop_indicator_animation(self):
+        """Cancel the pause blink"""
+        if self._anim_id:
+            self.after_cancel(self._anim_id)
+            self._anim_id = None
 
     def toggle_pause(self):
         """Toggle pause and update visuals"""
@@ -172,15 +237,34 @@ class RecordingWidget(ctk.CTkToplevel):
     def set_paused(self, paused: bool):
         """Update pause state and visuals"""
         self.is_paused = paused
-        self.pause_btn.configure(text="▶" if paused else "⏸")
+        self._last_progress = None  # The FPS label is overwritten while paused
+        self._set_options(self.pause_btn, text="▶" if paused else "⏸")
         
+        # Time and progress are frozen while paused: stop polling them
+        self._suspend_updates()
         if paused:
-            self.frame.configure(border_color="#888888")
-            self.time_label.configure(text_color="#888888")
-            self.fps_label.configure(text="FPS: PAUSED")
+            self._set_options(self.frame, border_color="#888888")
+            self._set_options(self.time_label, text_color="#888888")
+            self._set_options(self.fps_label, text="FPS: PAUSED")
+            if self._anim_id is None:
+                self._animate_indicator()
         else:
-            self.frame.configure(border_color=NEON_BLUE)
-            self.time_label.configure(text_color="white")
+            self._set_options(self.frame, border_color=NEON_BLUE)
+            self._set_options(self.time_label, text_color="white")
+            self._stop_indicator_animation()
+            self._pause_flash = False
+            self._set_options(self.rec_indicator, text="●", text_color="#FF3333")
+        # Paused: show the frozen time once; resumed: restart both polls
+        self.update_timer()
+        self.update_progress()
+
+    def _set_options(self, widget, **options):
+        """configure() only the options that differ from what the widget already shows"""
+        shown = self._shown.setdefault(widget, {})
+        changed = {key: value for key, value in options.items() if shown.get(key) != value}
+        if changed:
+            shown.update(changed)
+            widget.configure(**changed)
 
     def _on_stop_click(self):
         """Handle stop button"""
@@ -189,6 +273,17 @@ class RecordingWidget(ctk.CTkToplevel):
 
     def _cancel_updates(self):
         """Cancel all scheduled updates"""
+        self._stop_indicator_animation()
+        self._suspend_updates()
+        if self._move_id:
+            self.after_cancel(self._move_id)
+            self._move_id = None
+        if self._exclusion_id:
+            self.after_cancel(self._exclusion_id)
+            self._exclusion_id = None
+
+    def _suspend_updates(self):
+        """Cancel the timer and progress polls"""
         if self._update_id:
             self.after_cancel(self._update_id)
             self._update_id = None
@@ -206,65 +301,74 @@ class RecordingWidget(ctk.CTkToplevel):
         else:
             elapsed = 0
         
-        elapsed = int(elapsed)
-        hours, remainder = divmod(elapsed, 3600)
-        mins, secs = divmod(remainder, 60)
+        # Format and redraw only when the displayed second changes
+        secs = int(elapsed)
+        if secs != self._last_timer_secs:
+            self._last_timer_secs = secs
+            self._set_options(self.time_label, text=format_elapsed(secs))
         
-        if hours > 0:
-            self.time_label.configure(text=f"{hours:01d}:{mins:02d}:{secs:02d}")
-        else:
-            self.time_label.configure(text=f"{mins:02d}:{secs:02d}")
-        
-        self._update_id = self.after(100, self.update_timer)
+        if self.is_paused:
+            self._update_id = None
+            return
+        delay = 1000 - int(elapsed * 1000) % 1000 + TIMER_SLACK_MS
+        self._update_id = self.after(delay, self.update_timer)
 
     def update_progress(self):
         """Update progress display (FPS, bitrate, dropped)"""
-        if not self.winfo_exists():
+        self._progress_id = None
+        if not self.winfo_exists() or self.is_paused:
             return
 
-        try:
-            if self.get_progress and not self.is_paused:
-                progress = self.get_progress()
-                
-                # FPS
-                fps_text = f"FPS: {progress.fps:.0f}" if progress.fps > 0 else "FPS: --"
-                self.fps_label.configure(text=fps_text)
-                
-                # Color FPS based on performance
-                if progress.fps > 0:
-                    expected_fps = 60  # Could get from settings
-                    if progress.fps >= expected_fps * 0.95:
-                        self.fps_label.configure(text_color="#00FF00")  # Green
-                    elif progress.fps >= expected_fps * 0.8:
-                        self.fps_label.configure(text_color="#FFAA00")  # Yellow
-                    else:
-                        self.fps_label.configure(text_color="#FF6666")  # Red
-                
-                # Bitrate
-                bitrate_text = f"Bitrate: {progress.bitrate}"
-                self.bitrate_label.configure(text=bitrate_text)
-                
-                # Dropped frames warning
-                if progress.dropped > 0:
-                    self.dropped_label.configure(text=f"Dropped: {progress.dropped}")
-                else:
-                    self.dropped_label.configure(text="")
-        except Exception:
-            # Ignore transient errors during updates to prevent loop death
-            pass
-        
+        # Reschedule first so an error in one tick cannot end the loop
         self._progress_id = self.after(500, self.update_progress)
+        if not self.get_progress:
+            return
+        # Minimized or withdrawn: nothing to redraw until it is shown again
+        if not self.winfo_ismapped():
+            return
+
+        progress = self.get_progress()
+        snapshot = (progress.fps, progress.bitrate, progress.dropped)
+        if snapshot == self._last_progress:
+            return
+        self._last_progress = snapshot
+        fps, bitrate, dropped = snapshot
+
+        # FPS, colored by performance
+        if fps > 0:
+            expected_fps = 60  # Could get from settings
+            if fps >= expected_fps * 0.95:
+                fps_color = "#00FF00"  # Green
+            elif fps >= expected_fps * 0.8:
+                fps_color = "#FFAA00"  # Yellow
+            else:
+                fps_color = "#FF6666"  # Red
+            self._set_options(self.fps_label, text=FMT_FPS % fps, text_color=fps_color)
+        else:
+            self._set_options(self.fps_label, text="FPS: --")
+
+        self._set_options(self.bitrate_label, text=FMT_BITRATE % bitrate)
+
+        # Dropped frames warning
+        self._set_options(self.dropped_label, text=FMT_DROPPED % dropped if dropped > 0 else "")
 
     def start_move(self, event):
-        self.x = event.x
-        self.y = event.y
+        self._drag_x = event.x_root - self.winfo_x()
+        self._drag_y = event.y_root - self.winfo_y()
 
     def do_move(self, event):
-        deltax = event.x - self.x
-        deltay = event.y - self.y
-        x = self.winfo_x() + deltax
-        y = self.winfo_y() + deltay
-        self.geometry(f"+{x}+{y}")
+        """Record the drag target; the window moves once per idle pass"""
+        self._move_pending = (event.x_root - self._drag_x, event.y_root - self._drag_y)
+        if self._move_id is None:
+            self._move_id = self.after_idle(self._apply_move)
+
+    def _apply_move(self):
+        """Move to the latest dragged position"""
+        self._move_id = None
+        if self._move_pending is None:
+            return
+        self.geometry("%+d%+d" % self._move_pending)
+        self._move_pending = None
 
     def destroy(self):
         """Clean up before destroying"""
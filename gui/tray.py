@@ -4,12 +4,39 @@ Allows running in background with hotkey support.
 """
 
 import threading
+from functools import lru_cache
 from typing import Callable, Optional
-from PIL import Image
 import os
 from config import ICONS_DIR, APP_NAME
 from utils.logger import get_logger
 
+FALLBACK_ICON_SIZE = (64, 64)
+FALLBACK_ICON_COLOR = '#00F2FF'
+# Icons update_icon() switches between, decoded ahead of time by start()
+STATE_ICONS = ("rec.png", "stop.png")
+
+
+@lru_cache(maxsize=8)
+def _load_icon(path: Optional[str], mtime: Optional[float]):
+    """Decode an icon once per file version; ``None`` gives the fallback."""
+    from PIL import Image
+
+    if path is None:
+        return Image.new('RGB', FALLBACK_ICON_SIZE, color=FALLBACK_ICON_COLOR)
+    # Decode fully and in pystray's pixel format so a swap does no work
+    with Image.open(path) as image:
+        return image.convert('RGBA')
+
+
+def load_tray_icon(icon_name: str = "rec.png", fallback: bool = True):
+    """Return the cached icon from ICONS_DIR, or the fallback if it is missing."""
+    icon_path = os.path.join(ICONS_DIR, icon_name)
+    try:
+        mtime = os.stat(icon_path).st_mtime
+    except OSError:
+        return _load_icon(None, None) if fallback else None
+    return _load_icon(icon_path, mtime)
+
 
 class SystemTray:
     """
@@ -44,13 +71,7 @@ class SystemTray:
             self._logger.error("pystray not installed")
             return
         
-        # Load icon
-        icon_path = os.path.join(ICONS_DIR, "rec.png")
-        if os.path.exists(icon_path):
-            image = Image.open(icon_path)
-        else:
-            # Fallback: create simple icon
-            image = Image.new('RGB', (64, 64), color='#00F2FF')
+        image = load_tray_icon()
         
         # Create menu
         menu = Menu(
@@ -71,9 +92,18 @@ class SystemTray:
         self._running = True
         self._thread = threading.Thread(target=self._run, daemon=True)
         self._thread.start()
+        threading.Thread(target=self._preload_icons, daemon=True).start()
         
         self._logger.info("System tray started")
     
+    def _preload_icons(self):
+        """Warm the icon cache off the UI thread"""
+        for icon_name in STATE_ICONS:
+            try:
+                load_tray_icon(icon_name, fallback=False)
+            except Exception as e:
+                self._logger.error(f"Tray icon preload failed ({icon_name}): {e}")
+    
     def _run(self):
         """Run tray icon (blocking)"""
         try:
@@ -120,12 +150,13 @@ class SystemTray:
         if not self._icon:
             return
         
-        icon_path = os.path.join(ICONS_DIR, icon_name)
-        if os.path.exists(icon_path):
-            try:
-                self._icon.icon = Image.open(icon_path)
-            except:
-                pass
+        try:
+            image = load_tray_icon(icon_name, fallback=False)
+        except Exception as e:
+            self._logger.error(f"Tray icon load failed: {e}")
+            return
+        if image is not None:
+            self._icon.icon = image
     
     def notify(self, title: str, message: str):
         """Show tray notification"""
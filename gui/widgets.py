@@ -10,7 +10,10 @@ class VUMeter(ctk.CTkFrame):
         self.level = 0
         self.width = width
         self.height = height
-        self._draw_meter()
+        # Bars are created once; level changes only move the level bar
+        self.canvas.create_rectangle(0, 0, width, height, fill="#3D3D3D", outline="")
+        self.level_bar = self.canvas.create_rectangle(0, 0, 0, height, fill=NEON_BLUE, outline="")
+        self._fill_width = 0
 
     def set_level(self, level):
         """level from 0 to 1"""
@@ -18,12 +21,12 @@ class VUMeter(ctk.CTkFrame):
         self._draw_meter()
 
     def _draw_meter(self, *args, **kwargs):
-        self.canvas.delete("all")
-        # Background bar
-        self.canvas.create_rectangle(0, 0, self.width, self.height, fill="#3D3D3D", outline="")
-        # Level bar
-        fill_width = self.level * self.width
-        self.canvas.create_rectangle(0, 0, fill_width, self.height, fill=NEON_BLUE, outline="")
+        fill_width = int(self.level * self.width)
+        # Sub-pixel level changes are invisible, skip the canvas call
+        if fill_width == self._fill_width:
+            return
+        self._fill_width = fill_width
+        self.canvas.coords(self.level_bar, 0, 0, fill_width, self.height)
 
 
 class ScenePreview(ctk.CTkFrame):
@@ -71,8 +74,8 @@ class ScenePreview(ctk.CTkFrame):
 
     def _draw_empty_state(self):
         self.canvas.create_text(
-            self.preview_width / 2,
-            self.preview_height / 2,
+            self.preview_width // 2,
+            self.preview_height // 2,
             text="No video source",
             font=("Segoe UI", 22, "bold"),
             fill="#6F7D8B",
@@ -5,7 +5,14 @@ import shutil
 import zipfile
 import winreg
 import sys
-from PIL import Image
+import queue
+import threading
+
+# How often the UI picks up progress from the install worker
+INSTALL_POLL_MS = 50
+# Share of the progress bar taken by the file copy, the rest is shortcuts
+COPY_PROGRESS = 0.9
+
 
 class NeoInstaller(ctk.CTk):
     def __init__(self):
@@ -64,41 +71,81 @@ class NeoInstaller(ctk.CTk):
         self.install_path = self.path_entry.get()
         self.install_btn.configure(state="disabled")
         self.status_label.configure(text="Installing...")
+        self.progress.set(0)
         
+        # Copying runs on a worker, the UI only drains its progress events
+        self._events = queue.Queue()
+        threading.Thread(target=self._install_worker, daemon=True).start()
+        self.after(INSTALL_POLL_MS, self._drain_events)
+
+    def _install_worker(self):
+        """Copy files and create shortcuts, reporting to the UI through the event queue"""
         try:
             if not os.path.exists(self.source_dir):
                  # For the sake of demonstration, we assume dist/NeoRecorder exists
                  # In a real scenario, we might use a ZIP embedded in the installer
                  pass
 
-            # Update progress simulated for UI
-            self.progress.set(0.3)
-            self.update_idletasks()
-            
             # Copy files
             if os.path.exists(self.install_path):
                 shutil.rmtree(self.install_path, ignore_errors=True)
             
-            shutil.copytree(self.source_dir, self.install_path)
+            total = self._source_size() or 1
+            copied = 0
+
+            def copy_with_progress(src, dst):
+                nonlocal copied
+                shutil.copy2(src, dst)
+                copied += os.path.getsize(src)
+                self._events.put(("progress", COPY_PROGRESS * copied / total))
+                return dst
+
+            shutil.copytree(self.source_dir, self.install_path, copy_function=copy_with_progress)
             
             # Copy ffmpeg if it's in the root
             ffmpeg_src = os.path.join(os.path.dirname(os.path.abspath(__file__)), "ffmpeg.exe")
             if os.path.exists(ffmpeg_src):
                 shutil.copy2(ffmpeg_src, os.path.join(self.install_path, "ffmpeg.exe"))
 
-            self.progress.set(0.7)
-            self.status_label.configure(text="Creating shortcuts...")
-            self.update_idletasks()
+            self._events.put(("progress", COPY_PROGRESS))
+            self._events.put(("status", "Creating shortcuts..."))
             
             self.create_shortcut()
             
-            self.progress.set(1.0)
-            self.status_label.configure(text="Installation Complete!")
-            self.install_btn.configure(text="FINISH", state="normal", command=self.destroy)
+            self._events.put(("done", None))
             
         except Exception as e:
-            self.status_label.configure(text=f"Error: {str(e)}")
-            self.install_btn.configure(state="normal")
+            self._events.put(("error", str(e)))
+
+    def _source_size(self):
+        """Total bytes to copy, for a real progress bar"""
+        total = 0
+        for root, _dirs, files in os.walk(self.source_dir):
+            for name in files:
+                total += os.path.getsize(os.path.join(root, name))
+        return total
+
+    def _drain_events(self):
+        """Apply progress events from the install worker"""
+        while True:
+            try:
+                kind, value = self._events.get_nowait()
+            except queue.Empty:
+                break
+            if kind == "progress":
+                self.progress.set(value)
+            elif kind == "status":
+                self.status_label.configure(text=value)
+            elif kind == "done":
+                self.progress.set(1.0)
+                self.status_label.configure(text="Installation Complete!")
+                self.install_btn.configure(text="FINISH", state="normal", command=self.destroy)
+                return
+            elif kind == "error":
+                self.status_label.configure(text=f"Error: {value}")
+                self.install_btn.configure(state="normal")
+                return
+        self.after(INSTALL_POLL_MS, self._drain_events)
 
     def create_shortcut(self):
         # This part requires winshell or pywin32, which we have
@@ -111,12 +158,17 @@ class NeoInstaller(ctk.CTk):
         w_dir = self.install_path
         icon = target
 
-        shell = Dispatch('WScript.Shell')
-        shortcut = shell.CreateShortCut(path)
-        shortcut.Targetpath = target
-        shortcut.WorkingDirectory = w_dir
-        shortcut.IconLocation = icon
-        shortcut.save()
+        # Runs on the install worker, which needs its own COM apartment
+        pythoncom.CoInitialize()
+        try:
+            shell = Dispatch('WScript.Shell')
+            shortcut = shell.CreateShortCut(path)
+            shortcut.Targetpath = target
+            shortcut.WorkingDirectory = w_dir
+            shortcut.IconLocation = icon
+            shortcut.save()
+        finally:
+            pythoncom.CoUninitialize()
 
 if __name__ == "__main__":
     app = NeoInstaller()
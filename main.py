@@ -11,17 +11,22 @@ from ctypes import wintypes
 # Using Windows Mutex to ensure only one instance runs
 
 MUTEX_NAME = "NeoRecorder_SingleInstance_Mutex"
+ERROR_ALREADY_EXISTS = 183
 
 def is_already_running():
     """Check if another instance is already running using Windows Mutex"""
-    kernel32 = ctypes.windll.kernel32
+    # Own kernel32 instance: ctypes saves the last error right after each call
+    kernel32 = ctypes.WinDLL("kernel32", use_last_error=True)
+    kernel32.CreateMutexW.argtypes = [wintypes.LPVOID, wintypes.BOOL, wintypes.LPCWSTR]
+    kernel32.CreateMutexW.restype = wintypes.HANDLE
+    kernel32.CloseHandle.argtypes = [wintypes.HANDLE]
     
-    # Try to create mutex
-    handle = kernel32.CreateMutexW(None, True, MUTEX_NAME)
-    last_error = kernel32.GetLastError()
+    # Existence of the named mutex is the signal, nobody owns it
+    ctypes.set_last_error(0)
+    handle = kernel32.CreateMutexW(None, False, MUTEX_NAME)
+    last_error = ctypes.get_last_error()
     
-    # ERROR_ALREADY_EXISTS = 183
-    if last_error == 183:
+    if last_error == ERROR_ALREADY_EXISTS:
         kernel32.CloseHandle(handle)
         return True
     
@@ -30,16 +35,37 @@ def is_already_running():
 
 def focus_existing_window():
     """Try to bring existing NeoRecorder window to front"""
-    user32 = ctypes.windll.user32
+    user32 = ctypes.WinDLL("user32")
+    kernel32 = ctypes.WinDLL("kernel32")
+    user32.FindWindowW.argtypes = [wintypes.LPCWSTR, wintypes.LPCWSTR]
+    user32.FindWindowW.restype = wintypes.HWND
+    user32.GetWindowThreadProcessId.argtypes = [wintypes.HWND, wintypes.LPDWORD]
+    user32.GetWindowThreadProcessId.restype = wintypes.DWORD
+    user32.GetForegroundWindow.restype = wintypes.HWND
+    user32.AttachThreadInput.argtypes = [wintypes.DWORD, wintypes.DWORD, wintypes.BOOL]
+    user32.ShowWindow.argtypes = [wintypes.HWND, ctypes.c_int]
+    user32.BringWindowToTop.argtypes = [wintypes.HWND]
+    user32.SetForegroundWindow.argtypes = [wintypes.HWND]
     
     # Find window by title
     hwnd = user32.FindWindowW(None, "NeoRecorder")
-    if hwnd:
-        # SW_RESTORE = 9, SW_SHOW = 5
+    if not hwnd:
+        return False
+    
+    # Windows only lets a process take the foreground while its thread
+    # shares the input queue of the window that currently has it
+    foreground_tid = user32.GetWindowThreadProcessId(user32.GetForegroundWindow(), None)
+    current_tid = kernel32.GetCurrentThreadId()
+    attached = foreground_tid and foreground_tid != current_tid and user32.AttachThreadInput(current_tid, foreground_tid, True)
+    try:
+        # SW_RESTORE = 9
         user32.ShowWindow(hwnd, 9)
+        user32.BringWindowToTop(hwnd)
         user32.SetForegroundWindow(hwnd)
-        return True
-    return False
+    finally:
+        if attached:
+            user32.AttachThreadInput(current_tid, foreground_tid, False)
+    return True
 
 # Check single instance BEFORE importing heavy modules
 if is_already_running():
@@ -52,10 +78,10 @@ try:
 except Exception:
     ctypes.windll.user32.SetProcessDPIAware()
 
-# === IMPORT APP ===
-from gui.app import NeoRecorderApp
-
 if __name__ == "__main__":
+    # === IMPORT APP ===
+    from gui.app import NeoRecorderApp
+
     app = NeoRecorderApp()
     app.protocol("WM_DELETE_WINDOW", app.on_closing)
     app.mainloop()
@@ -1,8 +1,46 @@
+import io
 import os
 import shutil
 import datetime
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+# Потоков для копирования: работа упирается в ввод-вывод, а не в GIL
+MAX_COPY_WORKERS = 32
+
+def find_py_files(project_root, ignore_dirs):
+    """Обход дерева через os.scandir: тип записи берется из DirEntry без лишних stat()
+
+    Пути возвращаются строками: относительный путь — это срез полного, без Path.relative_to().
+    """
+    py_files = []
+    root = str(project_root)
+    root_len = len(root) + 1
+    stack = [root]
+    while stack:
+        subdirs = []
+        with os.scandir(stack.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    # Игнорируемые папки отсекаем до спуска в них
+                    if entry.name not in ignore_dirs:
+                        subdirs.append(entry.path)
+                elif entry.is_file(follow_symlinks=False) and entry.name.endswith('.py') and entry.name != 'make_backup.py':
+                    py_files.append((entry.path, entry.path[root_len:]))
+        # В обратном порядке, чтобы папки обходились в том же порядке, что и в os.walk
+        stack.extend(reversed(subdirs))
+    return py_files
+
+def backup_file(full_path, target_path):
+    """Копирует файл в бэкап и возвращает его содержимое (или текст ошибки чтения)"""
+    # Копируем файл (copy2 сам использует системное копирование)
+    shutil.copy2(full_path, target_path)
+    try:
+        with open(full_path, "rb") as f:
+            return f.read()
+    except Exception as e:
+        return f"ERROR READING FILE: {e}".encode("utf-8")
+
 def create_backup():
     # 1. Настройка путей и времени
     timestamp = datetime.datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
@@ -20,51 +58,53 @@ def create_backup():
     
     print(f"🚀 Запуск бэкапа в папку: {timestamp}")
     
-    py_files = []
-    
     # 2. Поиск всех .py файлов
-    for root, dirs, files in os.walk(project_root):
-        # Удаляем игнорируемые папки из обхода
-        dirs[:] = [d for d in dirs if d not in ignore_dirs]
-        
-        for file in files:
-            if file.endswith('.py') and file != 'make_backup.py':
-                full_path = Path(root) / file
-                rel_path = full_path.relative_to(project_root)
-                py_files.append((full_path, rel_path))
+    py_files = find_py_files(project_root, ignore_dirs)
+
+    # Папки в бэкапе создаем заранее и последовательно, чтобы потоки не гонялись за mkdir
+    # Каждую папку создаем один раз, а не по mkdir на каждый файл
+    backup_root = str(backup_dir)
+    created_dirs = set()
+    targets = []
+    for full_path, rel_path in py_files:
+        # Путь в бэкапе (сохраняем структуру папок)
+        target_path = os.path.join(backup_root, rel_path)
+        parent = os.path.dirname(target_path)
+        if parent not in created_dirs:
+            os.makedirs(parent, exist_ok=True)
+            created_dirs.add(parent)
+        targets.append(target_path)
 
     # 3. Копирование файлов и сборка текста
-    with open(text_backup_file, "w", encoding="utf-8") as combined_file:
-        # Красивый заголовок для всего файла
-        combined_file.write("="*80 + "\n")
-        combined_file.write(f" NEORECORDER PROJECT SOURCE BACKUP\n")
-        combined_file.write(f" Date: {datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-        combined_file.write(f" Total files: {len(py_files)}\n")
-        combined_file.write("="*80 + "\n\n")
+    # Текст собирается в памяти (это лишь исходники, несколько МБ) и пишется на диск одним вызовом
+    combined = io.BytesIO()
 
-        for full_path, rel_path in py_files:
-            # Путь в бэкапе (сохраняем структуру папок)
-            target_path = backup_dir / rel_path
-            target_path.parent.mkdir(parents=True, exist_ok=True)
-            
-            # Копируем файл
-            shutil.copy2(full_path, target_path)
-            
+    def write_text(text):
+        combined.write(text.encode("utf-8"))
+
+    # Красивый заголовок для всего файла
+    write_text("="*80 + "\n")
+    write_text(f" NEORECORDER PROJECT SOURCE BACKUP\n")
+    write_text(f" Date: {datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
+    write_text(f" Total files: {len(py_files)}\n")
+    write_text("="*80 + "\n\n")
+
+    # Копирование и чтение идут параллельно, а текст собирается в исходном порядке файлов
+    with ThreadPoolExecutor(max_workers=max(1, min(MAX_COPY_WORKERS, len(py_files)))) as executor:
+        contents = executor.map(backup_file, (full_path for full_path, _ in py_files), targets)
+        for (full_path, rel_path), content in zip(py_files, contents):
             # Пишем в текстовый бэкап
             print(f"  + Обработка: {rel_path}")
             
-            combined_file.write("\n" + "#"*80 + "\n")
-            combined_file.write(f"### FILE: {rel_path}\n")
-            combined_file.write("#"*80 + "\n\n")
+            write_text("\n" + "#"*80 + "\n")
+            write_text(f"### FILE: {rel_path}\n")
+            write_text("#"*80 + "\n\n")
             
-            try:
-                with open(full_path, "r", encoding="utf-8") as f:
-                    content = f.read()
-                    combined_file.write(content)
-            except Exception as e:
-                combined_file.write(f"ERROR READING FILE: {e}")
+            combined.write(content)
             
-            combined_file.write("\n\n")
+            write_text("\n\n")
+
+    text_backup_file.write_bytes(combined.getvalue())
 
     print(f"\n✅ Бэкап успешно завершен!")
     print(f"📂 Файлы скопированы в: {backup_dir}")
@@ -13,8 +13,9 @@ if str(ROOT_DIR) not in sys.path:
 
 
 class FakeImage:
-    def __init__(self, size=(100, 50), bgra=b"\x00" * 16):
+    def __init__(self, size=(100, 50), bgra=b"\x00" * 16, mode="RGB"):
         self.size = size
+        self.mode = mode
         self.bgra = bgra
         self.saved = []
 
@@ -27,9 +28,25 @@ class FakeImage:
 
         Path(path_or_buffer).write_bytes(payload)
 
-    def convert(self, _mode):
+    def convert(self, mode):
+        self.converted = mode
+        self.mode = mode
         return self
 
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_exc):
+        return False
+
+
+class FakePhotoImage:
+    def __init__(self, image):
+        self.image = image
+
+    def paste(self, image):
+        self.image = image
+
 
 class FakeEnhancer:
     def __init__(self, image):
@@ -46,6 +63,7 @@ class FakeCanvas:
         self.bindings = {}
         self.items = {}
         self.deleted = []
+        self.idle_flushes = 0
         self._next_id = 1
 
     def pack(self, *args, **kwargs):
@@ -63,6 +81,9 @@ class FakeCanvas:
     def create_rectangle(self, *args, **kwargs):
         return self._create_item("rectangle", args, kwargs)
 
+    def create_polygon(self, *args, **kwargs):
+        return self._create_item("polygon", args, kwargs)
+
     def bbox(self, item_id):
         if item_id in self.items:
             return (10, 10, 110, 40)
@@ -82,6 +103,12 @@ class FakeCanvas:
     def tag_raise(self, item_id):
         return item_id
 
+    def tag_lower(self, item_id):
+        return item_id
+
+    def update_idletasks(self):
+        self.idle_flushes += 1
+
     def _create_item(self, kind, coords, config=None):
         item_id = self._next_id
         self._next_id += 1
@@ -93,6 +120,10 @@ class FakeCanvas:
         return item_id
 
 
+class FakeTclError(Exception):
+    pass
+
+
 class FakeWidget:
     def __init__(self, master=None, **kwargs):
         self.master = master
@@ -102,6 +133,7 @@ class FakeWidget:
         self.config = dict(kwargs)
         self.exists = True
         self.after_calls = []
+        self.after_args = []
         self.geometry_value = ""
         self.value = ""
         self.selected = False
@@ -111,6 +143,8 @@ class FakeWidget:
         self.height = kwargs.get("height", 100)
         self.screen_width = 1920
         self.screen_height = 1080
+        self.pointer = (0, 0)
+        self.mapped = True
         self.canvas = None
         if master is not None and hasattr(master, "children"):
             master.children.append(self)
@@ -138,19 +172,26 @@ class FakeWidget:
     def bind(self, event, callback):
         self.bindings[event] = callback
 
-    def after(self, delay, callback=None):
+    def after(self, delay, callback=None, *args):
         self.after_calls.append((delay, callback))
+        self.after_args.append(args)
         token = f"after-{len(self.after_calls)}"
         if callback and getattr(self, "run_after_immediately", False):
-            callback()
+            callback(*args)
         return token
 
+    def after_idle(self, callback):
+        return self.after("idle", callback)
+
     def after_cancel(self, token):
         self.config["after_cancelled"] = token
 
     def winfo_exists(self):
         return self.exists
 
+    def winfo_ismapped(self):
+        return self.mapped
+
     def winfo_children(self):
         return list(self.children)
 
@@ -160,6 +201,9 @@ class FakeWidget:
     def winfo_screenheight(self):
         return self.screen_height
 
+    def winfo_pointerxy(self):
+        return self.pointer
+
     def winfo_fpixels(self, _value):
         return 96.0
 
@@ -195,6 +239,7 @@ class FakeWidget:
 
     def deiconify(self):
         self.config["deiconified"] = True
+        self.config["withdrawn"] = False
 
     def iconify(self):
         self.config["iconified"] = True
@@ -309,6 +354,7 @@ def _install_tk_modules():
     tk_module.Canvas = FakeCanvas
     tk_module.Frame = FakeWidget
     tk_module.Label = FakeWidget
+    tk_module.TclError = FakeTclError
     tk_module._default_root = None
     sys.modules["tkinter"] = tk_module
 
@@ -354,6 +400,7 @@ def _install_pillow_stubs():
     image_module = types.ModuleType("PIL.Image")
     image_module.Image = FakeImage
     image_module.frombytes = lambda *_args, **_kwargs: FakeImage()
+    image_module.frombuffer = lambda *_args, **_kwargs: FakeImage()
     image_module.new = lambda *_args, **_kwargs: FakeImage()
     image_module.open = lambda *_args, **_kwargs: FakeImage()
 
@@ -361,7 +408,7 @@ def _install_pillow_stubs():
     image_grab_module.grab = lambda *args, **kwargs: FakeImage()
 
     image_tk_module = types.ModuleType("PIL.ImageTk")
-    image_tk_module.PhotoImage = lambda image: image
+    image_tk_module.PhotoImage = FakePhotoImage
 
     image_enhance_module = types.ModuleType("PIL.ImageEnhance")
     image_enhance_module.Brightness = lambda image: FakeEnhancer(image)
@@ -411,6 +458,8 @@ def reset_singletons():
                 logger.removeHandler(handler)
                 handler.close()
         logger_module._loggers.clear()
+        if hasattr(logger_module, "stop_listeners"):
+            logger_module.stop_listeners()
 
     for module_name in [
         "config",
@@ -0,0 +1,31 @@
+import os
+import sys
+import types
+
+
+def test_on_closing_drains_log_listener_before_exit(fresh_import, monkeypatch, tmp_path):
+    monkeypatch.setenv("USERPROFILE", str(tmp_path))
+    monkeypatch.setenv("HOME", str(tmp_path))
+    app_module = fresh_import("gui.app")
+    logger_module = sys.modules["utils.logger"]
+    logger = app_module.get_logger()
+    log_dir = tmp_path / "Videos" / "NeoRecorder" / "logs"
+    logged_at_exit = []
+
+    def exit_process(code):
+        log_file = next(log_dir.glob("neorecorder_*.log"))
+        logged_at_exit.append((code, dict(logger_module._listeners), log_file.read_text(encoding="utf-8")))
+
+    monkeypatch.setattr(os, "_exit", exit_process)
+    app = types.SimpleNamespace(
+        _cleanup=lambda: logger.info("Recording stopped on quit"),
+        destroy=lambda: logger.info("Window destroyed"),
+    )
+
+    app_module.NeoRecorderApp.on_closing(app, force_quit=True)
+
+    code, running_listeners, log_text = logged_at_exit[0]
+    assert code == 0
+    assert running_listeners == {}
+    assert "Recording stopped on quit" in log_text
+    assert "Window destroyed" in log_text
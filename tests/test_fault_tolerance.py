@@ -44,8 +44,14 @@ class TestFaultTolerance(unittest.TestCase):
         success_process.poll.return_value = None  # Running
         success_process.returncode = None
         # Provide some initial output so monitor thread doesn't block or loop infinitely without data
+        success_process.stdout.readline.side_effect = [
+            b"frame=1\n",
+            b"fps=30.00\n",
+            b"progress=continue\n",
+            b""
+        ]
         success_process.stderr.readline.side_effect = [
-            b"frame=1 fps=30 size=100kB time=00:00:01.00 bitrate=1000kbits/s speed=1x",
+            b"Stream mapping:",
             b""
         ]
 
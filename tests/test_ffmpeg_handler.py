@@ -1,10 +1,23 @@
 import io
+import os
 from pathlib import Path
 import types
 
 import pytest
 
 
+ENCODERS_OUTPUT = """Encoders:
+ V..... = Video
+ A..... = Audio
+ ------
+ V....D libx264              libx264 H.264 / AVC / MPEG-4 AVC
+ V....D h264_amf             AMD AMF H.264 Encoder (codec h264)
+ V....D h264_nvenc           NVIDIA NVENC H.264 encoder (codec h264)
+ V....D h264_qsv             H.264 / AVC / MPEG-4 AVC (Intel Quick Sync Video acceleration) (codec h264)
+ A....D aac                  AAC (Advanced Audio Coding)
+"""
+
+
 class CompletedStub:
     def __init__(self, returncode=0, stdout="", stderr=b""):
         self.returncode = returncode
@@ -14,13 +27,22 @@ class CompletedStub:
 
 class StdinStub:
     def __init__(self):
-        self.payload = []
+        self._read_fd, self._write_fd = os.pipe()
 
-    def write(self, value):
-        self.payload.append(value)
+    def fileno(self):
+        return self._write_fd
 
-    def flush(self):
-        return None
+    def sent(self):
+        os.close(self._write_fd)
+        self._write_fd = None
+        with os.fdopen(self._read_fd, "rb") as pipe:
+            self._read_fd = None
+            return pipe.read()
+
+    def __del__(self):
+        for fd in (self._read_fd, self._write_fd):
+            if fd is not None:
+                os.close(fd)
 
 
 class StderrStub:
@@ -37,11 +59,18 @@ class StderrStub:
         return self.tail
 
 
+PROGRESS_BLOCK = (
+    b"frame=19\nfps=59.00\nstream_0_0_q=-0.0\nbitrate=   0.6kbits/s\ntotal_size=2048\n"
+    b"out_time_us=630000\nout_time=00:00:00.630000\ndup_frames=0\ndrop_frames=2\n"
+    b"speed=1.25x\nprogress=continue\n"
+)
+
+
 class PopenStub:
-    def __init__(self, returncode=None, lines=None):
+    def __init__(self, returncode=None, lines=None, progress=b""):
         self.returncode = returncode
         self.stdin = StdinStub()
-        self.stdout = io.BytesIO()
+        self.stdout = io.BytesIO(progress)
         self.stderr = StderrStub(lines=lines)
         self.terminated = False
         self.killed = False
@@ -68,7 +97,9 @@ class PopenStub:
 def load_handler(fresh_import, monkeypatch, tmp_path):
     monkeypatch.setenv("USERPROFILE", str(tmp_path))
     monkeypatch.setenv("HOME", str(tmp_path))
-    return fresh_import("utils.ffmpeg_handler")
+    handler_module = fresh_import("utils.ffmpeg_handler")
+    monkeypatch.setattr(handler_module, "ENCODER_CACHE_FILE", str(tmp_path / "encoders.json"))
+    return handler_module
 
 
 def test_get_available_encoders_returns_cached_value(fresh_import, monkeypatch, tmp_path):
@@ -84,9 +115,7 @@ def test_get_available_encoders_detects_supported_hardware(fresh_import, monkeyp
     monkeypatch.setattr(
         handler_module.subprocess,
         "run",
-        lambda *args, **kwargs: CompletedStub(
-            stdout="h264_nvenc\nh264_qsv\nh264_amf\n"
-        ),
+        lambda *args, **kwargs: CompletedStub(stdout=ENCODERS_OUTPUT.encode()),
     )
     handler = handler_module.FFmpegHandler()
     monkeypatch.setattr(
@@ -110,6 +139,65 @@ def test_get_available_encoders_returns_empty_on_failure(fresh_import, monkeypat
     assert handler.get_available_encoders() == []
 
 
+def test_get_available_encoders_reuses_disk_cache_for_same_ffmpeg(fresh_import, monkeypatch, tmp_path):
+    handler_module = load_handler(fresh_import, monkeypatch, tmp_path)
+    ffmpeg_path = tmp_path / "ffmpeg.exe"
+    ffmpeg_path.write_bytes(b"")
+    monkeypatch.setattr(handler_module, "FFMPEG_PATH", str(ffmpeg_path))
+    runs = []
+    monkeypatch.setattr(
+        handler_module.subprocess,
+        "run",
+        lambda *args, **kwargs: runs.append(args) or CompletedStub(stdout=ENCODERS_OUTPUT.encode()),
+    )
+    monkeypatch.setattr(
+        handler_module.FFmpegHandler, "_test_encoder", lambda self, encoder: encoder == "h264_qsv"
+    )
+
+    assert handler_module.FFmpegHandler().get_available_encoders() == ["h264_qsv"]
+    assert runs[0][0] == [str(ffmpeg_path), "-encoders", "-hide_banner"]
+    handler_module.FFmpegHandler._shared_encoders = None
+    assert handler_module.FFmpegHandler().get_available_encoders() == ["h264_qsv"]
+    assert len(runs) == 1
+
+    stat_result = ffmpeg_path.stat()
+    handler_module.os.utime(ffmpeg_path, ns=(stat_result.st_atime_ns, stat_result.st_mtime_ns + 1))
+    handler_module.FFmpegHandler._shared_encoders = None
+    handler_module.FFmpegHandler().get_available_encoders()
+    assert len(runs) == 2
+
+
+def test_get_available_encoders_shared_between_handlers(fresh_import, monkeypatch, tmp_path):
+    handler_module = load_handler(fresh_import, monkeypatch, tmp_path)
+    tested = []
+    monkeypatch.setattr(
+        handler_module.subprocess,
+        "run",
+        lambda *args, **kwargs: CompletedStub(stdout=ENCODERS_OUTPUT.encode()),
+    )
+    monkeypatch.setattr(
+        handler_module.FFmpegHandler,
+        "_test_encoder",
+        lambda self, encoder: tested.append(encoder) or encoder == "h264_nvenc",
+    )
+
+    first = handler_module.FFmpegHandler().get_available_encoders()
+    second = handler_module.FFmpegHandler().get_available_encoders()
+
+    assert first == second == ["h264_nvenc"]
+    assert tested == list(handler_module.ENCODER_PRIORITY)
+
+
+def test_parse_encoder_names_matches_whole_video_encoder_names(fresh_import, monkeypatch, tmp_path):
+    handler_module = load_handler(fresh_import, monkeypatch, tmp_path)
+
+    names = handler_module._parse_encoder_names(
+        ENCODERS_OUTPUT + " V....D hevc_nvenc_custom     not the h264_qsv you want\n"
+    )
+
+    assert {"h264_nvenc", "h264_qsv", "h264_amf", "libx264", "hevc_nvenc_custom"} == names
+
+
 def test_test_encoder_returns_true_on_zero_exit_code(fresh_import, monkeypatch, tmp_path):
     handler_module = load_handler(fresh_import, monkeypatch, tmp_path)
     monkeypatch.setattr(
@@ -155,6 +243,20 @@ def test_get_best_encoder_uses_priority(fresh_import, monkeypatch, tmp_path, enc
     assert handler.get_best_encoder() == expected
 
 
+def test_get_best_encoder_is_resolved_once(fresh_import, monkeypatch, tmp_path):
+    handler_module = load_handler(fresh_import, monkeypatch, tmp_path)
+    handler = handler_module.FFmpegHandler()
+    lookups = []
+    monkeypatch.setattr(handler, "get_available_encoders", lambda: lookups.append(1) or ["h264_nvenc"])
+
+    assert handler.get_best_encoder() == "h264_nvenc"
+    assert handler.get_best_encoder() == "h264_nvenc"
+    assert lookups == [1]
+
+    handler._safe_mode_active = True
+    assert handler.get_best_encoder() == "libx264"
+
+
 def test_encoder_candidates_filter_incompatible_hardware(fresh_import, monkeypatch, tmp_path):
     handler_module = load_handler(fresh_import, monkeypatch, tmp_path)
     handler = handler_module.FFmpegHandler()
@@ -278,11 +380,14 @@ def test_pause_stops_process_and_marks_paused(fresh_import, monkeypatch, tmp_pat
     handler_module = load_handler(fresh_import, monkeypatch, tmp_path)
     handler = handler_module.FFmpegHandler()
     handler._is_recording = True
-    handler.process = PopenStub()
+    process = PopenStub()
+    handler.process = process
 
     assert handler.pause() is True
     assert handler.process is None
     assert handler.is_paused() is True
+    assert process.stdin.sent() == b"q"
+    assert process.terminated is False
 
 
 def test_resume_returns_false_when_not_paused(fresh_import, monkeypatch, tmp_path):
@@ -297,7 +402,7 @@ def test_resume_updates_pause_duration_on_success(fresh_import, monkeypatch, tmp
     handler._is_recording = True
     handler._is_paused = True
     handler._pause_start = 10.0
-    monkeypatch.setattr(handler_module.time, "time", lambda: 15.0)
+    monkeypatch.setattr(handler_module.time, "monotonic", lambda: 15.0)
     monkeypatch.setattr(handler, "_start_segment", lambda: True)
 
     assert handler.resume() is True
@@ -350,10 +455,11 @@ def test_stop_recording_returns_result_and_resets_state(fresh_import, monkeypatc
     handler = handler_module.FFmpegHandler()
     handler.start_timestamp = 10.0
     handler._is_recording = True
-    handler.process = PopenStub()
+    process = PopenStub()
+    handler.process = process
     handler._segments = ["a.mp4"]
     handler._last_progress = handler_module.RecordingProgress(frame=10, fps=60)
-    monkeypatch.setattr(handler_module.time, "time", lambda: 20.0)
+    monkeypatch.setattr(handler_module.time, "monotonic", lambda: 20.0)
     monkeypatch.setattr(handler, "_merge_segments", lambda: "final.mp4")
     monkeypatch.setattr(handler, "_cleanup_temp", lambda: None)
 
@@ -361,6 +467,8 @@ def test_stop_recording_returns_result_and_resets_state(fresh_import, monkeypatc
 
     assert result["output_path"] == "final.mp4"
     assert result["duration"] == 10.0
+    assert process.stdin.sent() == b"q"
+    assert process.terminated is False
     assert handler._is_recording is False
     assert handler._recording_params is None
 
@@ -396,15 +504,22 @@ def test_merge_segments_uses_concat_for_multiple_files(fresh_import, monkeypatch
     handler._temp_dir = str(tmp_path)
     handler._final_output = str(tmp_path / "final.mp4")
     Path(handler._final_output).write_text("merged", encoding="utf-8")
+    commands = []
     monkeypatch.setattr(
         handler_module.subprocess,
         "run",
-        lambda *args, **kwargs: CompletedStub(returncode=0),
+        lambda cmd, **kwargs: commands.append((cmd, kwargs)) or CompletedStub(returncode=0),
     )
 
     result = handler._merge_segments()
 
     assert result == handler._final_output
+    cmd, kwargs = commands[0]
+    assert cmd.index("+genpts") < cmd.index("-i")
+    assert cmd[cmd.index("-i") + 1] == "pipe:0"
+    assert cmd[cmd.index("-avoid_negative_ts") + 1] == "make_zero"
+    assert kwargs["input"] == f"file '{first}'\nfile '{second}'\n".encode("utf-8")
+    assert not (tmp_path / "concat_list.txt").exists()
 
 
 def test_merge_segments_falls_back_to_last_segment_on_concat_error(
@@ -453,7 +568,7 @@ def test_get_elapsed_time_excludes_pause_duration(fresh_import, monkeypatch, tmp
     handler = handler_module.FFmpegHandler()
     handler.start_timestamp = 10.0
     handler._total_pause_duration = 3.0
-    monkeypatch.setattr(handler_module.time, "time", lambda: 20.0)
+    monkeypatch.setattr(handler_module.time, "monotonic", lambda: 20.0)
 
     assert handler.get_elapsed_time() == 7.0
 
@@ -462,9 +577,24 @@ def test_get_output_lines_respects_max_size(fresh_import, monkeypatch, tmp_path)
     handler_module = load_handler(fresh_import, monkeypatch, tmp_path)
     handler = handler_module.FFmpegHandler()
     for value in ["a", "b", "c"]:
-        handler._output_queue.put(value)
+        handler._output_queue.append(value)
 
     assert handler.get_output_lines(max_lines=2) == ["a", "b"]
+    assert handler.get_output_lines() == ["c"]
+
+
+def test_output_history_keeps_only_recent_lines(fresh_import, monkeypatch, tmp_path):
+    handler_module = load_handler(fresh_import, monkeypatch, tmp_path)
+    handler = handler_module.FFmpegHandler()
+    handler.process = PopenStub(lines=[f"line {index}\n".encode() for index in range(600)])
+
+    handler._start_output_monitor()
+    handler._monitor_thread.join(timeout=2)
+
+    lines = handler.get_output_lines(max_lines=1000)
+    assert len(lines) == handler_module.OUTPUT_HISTORY_SIZE
+    assert lines[0] == "line 100"
+    assert lines[-1] == "line 599"
 
 
 def test_get_dshow_audio_names_parses_unique_values(fresh_import, monkeypatch, tmp_path):
@@ -673,3 +803,161 @@ def test_try_ffmpeg_maps_audio_for_filter_graph(fresh_import, monkeypatch, tmp_p
     assert commands[0][commands[0].index("-map") + 1] == "[vout]"
     assert "2:a" in commands[0]
     assert "volume=0.35" in commands[0]
+
+
+def test_get_elapsed_time_ignores_wall_clock_jumps(fresh_import, monkeypatch, tmp_path):
+    handler_module = load_handler(fresh_import, monkeypatch, tmp_path)
+    handler = handler_module.FFmpegHandler()
+    handler.start_timestamp = 10.0
+    monkeypatch.setattr(handler_module.time, "time", lambda: 10_000.0)
+    monkeypatch.setattr(handler_module.time, "monotonic", lambda: 12.5)
+
+    assert handler.get_elapsed_time() == 2.5
+
+
+def test_output_monitor_waits_for_exit_and_reports_failure(fresh_import, monkeypatch, tmp_path):
+    handler_module = load_handler(fresh_import, monkeypatch, tmp_path)
+    handler = handler_module.FFmpegHandler()
+    errors = []
+    handler.set_callbacks(on_error=errors.append)
+    handler.process = PopenStub(progress=PROGRESS_BLOCK)
+    handler.process.wait = lambda timeout=None: handler.process.wait_calls.append(timeout) or 1
+
+    handler._start_output_monitor()
+    handler._monitor_thread.join(timeout=2)
+
+    assert handler.process.wait_calls == [None]
+    assert handler.get_progress().frame == 19
+    assert handler.get_progress().dropped == 2
+    assert errors == ["FFmpeg exited with code 1"]
+
+
+def test_parse_progress_block_reads_key_value_stream(fresh_import, monkeypatch, tmp_path):
+    handler_module = load_handler(fresh_import, monkeypatch, tmp_path)
+    values = dict(line.split(b"=", 1) for line in PROGRESS_BLOCK.splitlines())
+
+    progress = handler_module.parse_progress_block(values)
+
+    assert progress == handler_module.RecordingProgress(
+        frame=19,
+        fps=59.0,
+        bitrate="0.6kbits/s",
+        size="2KiB",
+        time="00:00:00.630000",
+        speed="1.25x",
+        dropped=2,
+    )
+    assert handler_module.parse_progress_block({b"fps": b"N/A", b"bitrate": b"N/A"}).bitrate == "0kbits/s"
+
+
+def test_try_ffmpeg_requests_progress_on_stdout(fresh_import, monkeypatch, tmp_path):
+    handler_module = load_handler(fresh_import, monkeypatch, tmp_path)
+    handler = handler_module.FFmpegHandler()
+    launches = []
+    monkeypatch.setattr(handler, "_encoder_candidates", lambda *_args: ["libx264"])
+    monkeypatch.setattr(handler, "_get_gdigrab_resolution", lambda: (1920, 1080))
+    monkeypatch.setattr(handler, "_start_output_monitor", lambda: None)
+    monkeypatch.setattr(
+        handler_module.subprocess,
+        "Popen",
+        lambda cmd, **kwargs: launches.append((cmd, kwargs)) or PopenStub(),
+    )
+
+    assert handler._try_ffmpeg(str(tmp_path / "out.mp4"), "gdigrab", None, None, False, None, 60, "balanced") is True
+
+    cmd, kwargs = launches[0]
+    assert cmd[cmd.index("-progress") + 1] == "pipe:1"
+    assert "-nostats" in cmd
+    assert "-hide_banner" in cmd
+    assert kwargs["stdout"] is handler_module.subprocess.PIPE
+
+
+def test_output_monitor_ignores_exit_of_released_segment(fresh_import, monkeypatch, tmp_path):
+    handler_module = load_handler(fresh_import, monkeypatch, tmp_path)
+    handler = handler_module.FFmpegHandler()
+    errors = []
+    handler.set_callbacks(on_error=errors.append)
+    process = PopenStub()
+
+    def wait(timeout=None):
+        handler.process = None
+        return 1
+
+    process.wait = wait
+    handler.process = process
+
+    handler._start_output_monitor()
+    handler._monitor_thread.join(timeout=2)
+
+    assert errors == []
+
+
+def test_system_width_sets_dpi_awareness_once(fresh_import, monkeypatch, tmp_path):
+    handler_module = load_handler(fresh_import, monkeypatch, tmp_path)
+    awareness_calls = []
+    windll = types.SimpleNamespace(
+        shcore=types.SimpleNamespace(SetProcessDpiAwareness=awareness_calls.append),
+        user32=types.SimpleNamespace(GetSystemMetrics=lambda _index: 2560),
+    )
+    monkeypatch.setattr(handler_module.ctypes, "windll", windll, raising=False)
+
+    assert handler_module.FFmpegHandler._system_width() == 2560
+    assert handler_module.FFmpegHandler._system_width() == 2560
+    assert awareness_calls == [2]
+
+
+def test_log_file_gets_header_then_buffered_ffmpeg_output(fresh_import, monkeypatch, tmp_path):
+    handler_module = load_handler(fresh_import, monkeypatch, tmp_path)
+    handler = handler_module.FFmpegHandler()
+    output_path = str(tmp_path / "clip.mp4")
+    handler._open_log_file(output_path, "libx264", 60, 60, "balanced", 1920, ["ffmpeg", "-y"])
+    handler.process = PopenStub(lines=[b"Stream mapping:\r\n", "Устройство\n".encode("cp1251")])
+
+    handler._start_output_monitor()
+    handler._monitor_thread.join(timeout=2)
+    handler._close_log_file()
+
+    log_text = (tmp_path / "clip.mp4.log").read_text(encoding="utf-8")
+    assert log_text.startswith("Encoder: libx264\n")
+    assert "Command: ffmpeg -y\n\n" in log_text
+    assert log_text.endswith("Stream mapping:\nУстройство\n")
+
+
+def test_stderr_drain_flushes_log_periodically(fresh_import, monkeypatch, tmp_path):
+    handler_module = load_handler(fresh_import, monkeypatch, tmp_path)
+    handler = handler_module.FFmpegHandler()
+    log_calls = []
+    handler._log_file = types.SimpleNamespace(
+        write=lambda data: log_calls.append(data),
+        flush=lambda: log_calls.append("flush"),
+    )
+    monkeypatch.setattr(handler_module.time, "monotonic", iter([0.0, 0.5, 2.5, 3.0]).__next__)
+    handler.process = PopenStub(lines=[b"one\n", b"two\n", b"three\n"])
+
+    handler._start_output_monitor()
+    handler._monitor_thread.join(timeout=2)
+
+    assert log_calls == [b"one\n", b"two\n", "flush", b"three\n"]
+
+
+@pytest.mark.parametrize(
+    ("encoder", "expected"),
+    [
+        ("libx264", ["-preset", "fast", "-tune", "zerolatency", "-crf", "20"]),
+        ("h264_nvenc", ["-preset", "p4", "-tune", "ll", "-rc", "vbr", "-cq", "25", "-b:v", "0"]),
+        ("h264_qsv", ["-preset", "faster", "-global_quality", "25"]),
+        ("h264_amf", ["-usage", "lowlatency", "-rc", "cqp", "-qp_i", "20", "-qp_p", "20", "-quality", "speed"]),
+    ],
+)
+def test_video_args_per_encoder(fresh_import, monkeypatch, tmp_path, encoder, expected):
+    handler_module = load_handler(fresh_import, monkeypatch, tmp_path)
+
+    assert handler_module.FFmpegHandler._video_args(encoder, handler_module.QUALITY_PRESETS["balanced"]) == expected
+
+
+def test_decode_output_line_tries_encodings_in_order(fresh_import, monkeypatch, tmp_path):
+    handler_module = load_handler(fresh_import, monkeypatch, tmp_path)
+
+    assert handler_module.decode_output_line(b"frame=  1 fps=0.0\n") == "frame=  1 fps=0.0\n"
+    assert handler_module.decode_output_line("Микрофон".encode("utf-8")) == "Микрофон"
+    assert handler_module.decode_output_line("Микрофон".encode("cp1251")) == "Микрофон"
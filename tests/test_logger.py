@@ -1,4 +1,5 @@
 import logging
+import logging.handlers
 import sys
 
 import pytest
@@ -29,6 +30,19 @@ def test_get_logger_skips_console_when_frozen(fresh_import, monkeypatch, tmp_pat
     assert len(logger.handlers) == 1
 
 
+def test_get_logger_writes_file_through_queue_listener(fresh_import, monkeypatch, tmp_path):
+    monkeypatch.setattr(sys, "frozen", True, raising=False)
+    logger_module = load_logger(fresh_import, monkeypatch, tmp_path)
+
+    logger = logger_module.get_logger()
+    logger_module.log_debug("queued message")
+    logger_module.stop_listeners()
+
+    assert isinstance(logger.handlers[0], logging.handlers.QueueHandler)
+    log_file = next((tmp_path / "Videos" / "NeoRecorder" / "logs").glob("neorecorder_*.log"))
+    assert "queued message" in log_file.read_text(encoding="utf-8")
+
+
 def test_get_logger_returns_cached_instance(fresh_import, monkeypatch, tmp_path):
     logger_module = load_logger(fresh_import, monkeypatch, tmp_path)
 
@@ -107,6 +121,7 @@ def test_log_debug_uses_debug_level(fresh_import, monkeypatch, tmp_path):
     [
         ("error while encoding", logging.WARNING),
         ("warning: slow capture", logging.WARNING),
+        ("Conversion FAILED!", logging.WARNING),
         ("frame=10 fps=60", logging.DEBUG),
     ],
 )
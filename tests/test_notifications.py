@@ -1,3 +1,6 @@
+import types
+
+
 def load_notifications(fresh_import):
     return fresh_import("utils.notifications")
 
@@ -50,3 +53,79 @@ def test_legacy_toast_wrapper_schedules_notification(fresh_import):
 
     assert calls[0] == 0
     assert calls[1][1]["duration"] == 1.5
+
+
+def run_pending_after(widget):
+    _delay, callback = widget.after_calls[-1]
+    callback(*widget.after_args[-1])
+
+
+def test_toast_fade_in_steps_through_keyframes(fresh_import, fake_widget):
+    notifications = load_notifications(fresh_import)
+    toast = fake_widget
+
+    notifications.NeoToast._start_animation(toast, notifications.FADE_IN_FRAMES)
+    for _ in range(len(notifications.FADE_IN_FRAMES)):
+        run_pending_after(toast)
+
+    alphas = [args[1] for args in toast.config["attributes"]]
+    assert alphas == [alpha for alpha, _delay in notifications.FADE_IN_FRAMES]
+    assert alphas[-1] == 0.95
+    assert notifications.NeoToast._anim_id is None
+
+
+def test_toast_dismiss_replaces_running_fade_and_hides(fresh_import, fake_widget):
+    notifications = load_notifications(fresh_import)
+    toast = fake_widget
+    notifications.NeoToast._active_toast = toast
+
+    notifications.NeoToast._start_animation(toast, notifications.FADE_IN_FRAMES)
+    fade_in_id = notifications.NeoToast._anim_id
+    notifications.NeoToast._dismiss(toast)
+
+    assert toast.config["after_cancelled"] == fade_in_id
+    for _ in range(len(notifications.FADE_OUT_FRAMES)):
+        run_pending_after(toast)
+
+    assert toast.config["withdrawn"] is True
+    assert toast.exists is True
+    assert notifications.NeoToast._active_toast is None
+
+
+def test_replacing_toast_cancels_pending_callbacks(fresh_import, fake_widget):
+    notifications = load_notifications(fresh_import)
+    toast = fake_widget
+    notifications.NeoToast._active_toast = toast
+    notifications.NeoToast._anim_id = "after-1"
+    notifications.NeoToast._dismiss_id = "after-2"
+    cancelled = []
+    toast.after_cancel = cancelled.append
+
+    notifications.NeoToast._close_active()
+
+    assert cancelled == ["after-1", "after-2"]
+    assert toast.config["withdrawn"] is True
+    assert notifications.NeoToast._anim_id is None
+    assert notifications.NeoToast._dismiss_id is None
+    assert notifications.NeoToast._active_toast is None
+
+
+def test_toast_window_is_reused_between_toasts(fresh_import, monkeypatch):
+    notifications = load_notifications(fresh_import)
+    bounds = notifications.DisplayBounds(left=0, top=0, width=1920, height=1080)
+    display_manager = types.SimpleNamespace(
+        get_primary_monitor=lambda: types.SimpleNamespace(bounds=bounds)
+    )
+    monkeypatch.setattr(notifications, "get_display_manager", lambda: display_manager)
+
+    notifications.show_notification("First", "one", footer="footer")
+    toast = notifications.NeoToast._active_toast
+    parts = notifications.NeoToast._toast_parts
+    notifications.show_notification("Second", "two", footer="")
+
+    assert notifications.NeoToast._active_toast is toast
+    assert notifications.NeoToast._toast_parts is parts
+    assert toast.exists is True
+    assert toast.config["withdrawn"] is False
+    assert parts.title.config["text"] == "Second"
+    assert parts.footer.config["packed"] is False
@@ -1,4 +1,6 @@
+import ctypes
 import types
+from concurrent.futures import Future
 
 
 def load_quick_overlay(fresh_import):
@@ -51,3 +53,212 @@ def test_quick_overlay_routes_record_mode(fresh_import, monkeypatch, fake_widget
 
     assert shots == []
     assert records == [(10, -180, 50, -120)]
+
+
+def test_quick_overlay_polls_pointer_while_selecting(fresh_import, monkeypatch, fake_widget):
+    overlay_module = load_quick_overlay(fresh_import)
+    display_module = fresh_import("utils.display_manager")
+    monkeypatch.setattr(
+        overlay_module,
+        "get_display_manager",
+        lambda: DisplayManagerStub(display_module.DisplayBounds(left=0, top=0, width=1920, height=1080)),
+    )
+
+    overlay = overlay_module.QuickOverlay(fake_widget, lambda _rect: None, lambda _rect: None)
+    overlay._on_press(types.SimpleNamespace(x=300, y=300))
+    overlay.selection_win.pointer = (400, 420)
+    overlay._poll_pointer()
+
+    assert overlay.canvas.items[overlay.rect_id]["coords"] == (300, 300, 400, 420)
+    assert overlay.canvas.items[overlay.size_label_id]["config"]["text"] == "100 × 120"
+
+    overlay._on_release(types.SimpleNamespace(x=400, y=420))
+
+    assert overlay._poll_id is None
+
+
+def test_quick_overlay_toolbar_drag_coalesces_moves(fresh_import, monkeypatch, fake_widget):
+    overlay_module = load_quick_overlay(fresh_import)
+    display_module = fresh_import("utils.display_manager")
+    monkeypatch.setattr(
+        overlay_module,
+        "get_display_manager",
+        lambda: DisplayManagerStub(display_module.DisplayBounds(left=0, top=0, width=1920, height=1080)),
+    )
+
+    overlay = overlay_module.QuickOverlay(fake_widget, lambda _rect: None, lambda _rect: None)
+    overlay._start_drag(types.SimpleNamespace(x=10, y=10, x_root=880, y_root=40))
+    overlay._do_drag(types.SimpleNamespace(x=0, y=0, x_root=950, y_root=100))
+    overlay._do_drag(types.SimpleNamespace(x=0, y=0, x_root=980, y_root=140))
+
+    moves = [call for call in overlay.toolbar.after_calls if call[1] == overlay._apply_geometry]
+    assert len(moves) == 1
+
+    flushes = []
+    overlay.toolbar.update_idletasks = lambda: flushes.append(True)
+    overlay._apply_geometry()
+
+    assert overlay.toolbar.geometry_value == "+970+130"
+    assert overlay.toolbar_rect == (970, 130, 1150, 180)
+    assert flushes == []
+
+
+def test_quick_overlay_hides_windows_before_screenshot_callback(fresh_import, monkeypatch, fake_widget):
+    overlay_module = load_quick_overlay(fresh_import)
+    display_module = fresh_import("utils.display_manager")
+    monkeypatch.setattr(
+        overlay_module,
+        "get_display_manager",
+        lambda: DisplayManagerStub(display_module.DisplayBounds(left=0, top=0, width=1920, height=1080)),
+    )
+    flushed = []
+    monkeypatch.setattr(fake_widget, "update_idletasks", lambda: flushed.append(True))
+    visible_during_capture = []
+
+    def capture(_rect):
+        visible_during_capture.append(overlay.selection_win.exists or not overlay.toolbar.config["withdrawn"])
+
+    overlay = overlay_module.QuickOverlay(fake_widget, capture, lambda _rect: None)
+    overlay._on_press(types.SimpleNamespace(x=300, y=300))
+    overlay._on_release(types.SimpleNamespace(x=400, y=420))
+
+    assert visible_during_capture == [False]
+    assert flushed == [True]
+
+
+def test_quick_overlay_toolbar_canvas_hit_tests_buttons(fresh_import, monkeypatch, fake_widget):
+    overlay_module = load_quick_overlay(fresh_import)
+    display_module = fresh_import("utils.display_manager")
+    monkeypatch.setattr(
+        overlay_module,
+        "get_display_manager",
+        lambda: DisplayManagerStub(display_module.DisplayBounds(left=0, top=0, width=1920, height=1080)),
+    )
+    closed = []
+
+    overlay = overlay_module.QuickOverlay(
+        fake_widget, lambda _rect: None, lambda _rect: None, lambda: closed.append(True)
+    )
+    overlay._on_toolbar_press(types.SimpleNamespace(x=70, y=20, x_root=940, y_root=50))
+
+    record_fill = overlay.toolbar_canvas.items[overlay._button_ids["record"]]["config"]["fill"]
+    assert overlay.current_mode == "record"
+    assert record_fill == overlay_module.MODE_COLORS["record"]
+    assert overlay._drag_x is None
+
+    overlay._on_toolbar_press(types.SimpleNamespace(x=150, y=20, x_root=1020, y_root=50))
+
+    assert closed == [True]
+
+
+def test_quick_overlay_shows_windows_after_background_capture(fresh_import, monkeypatch, fake_widget, fake_image):
+    overlay_module = load_quick_overlay(fresh_import)
+    display_module = fresh_import("utils.display_manager")
+    monkeypatch.setattr(
+        overlay_module,
+        "get_display_manager",
+        lambda: DisplayManagerStub(display_module.DisplayBounds(left=0, top=0, width=1920, height=1080)),
+    )
+    capture = Future()
+    monkeypatch.setattr(overlay_module, "grab_virtual_screen_async", lambda: capture)
+
+    overlay = overlay_module.QuickOverlay(fake_widget, lambda _rect: None, lambda _rect: None)
+
+    assert overlay.selection_win.config["withdrawn"] is True
+    assert overlay.toolbar.config["withdrawn"] is True
+    assert "deiconified" not in overlay.selection_win.config
+    assert overlay.selection_win.after_calls[-1] == (overlay_module.CAPTURE_POLL_MS, overlay._check_capture)
+
+    capture.set_result(fake_image)
+    overlay._check_capture()
+
+    assert overlay.screenshot is fake_image
+    assert overlay.selection_win.config["deiconified"] is True
+    assert overlay.toolbar.config["deiconified"] is True
+    assert ("idle", overlay._set_exclusion) in overlay.toolbar.after_calls
+    assert any(item["kind"] == "image" for item in overlay.canvas.items.values())
+
+
+def test_quick_overlay_relifts_toolbar_only_when_covered(fresh_import, monkeypatch, fake_widget):
+    overlay_module = load_quick_overlay(fresh_import)
+    display_module = fresh_import("utils.display_manager")
+    monkeypatch.setattr(
+        overlay_module,
+        "get_display_manager",
+        lambda: DisplayManagerStub(display_module.DisplayBounds(left=0, top=0, width=1920, height=1080)),
+    )
+
+    overlay = overlay_module.QuickOverlay(fake_widget, lambda _rect: None, lambda _rect: None)
+
+    assert all(delay != 100 for delay, _callback in overlay.toolbar.after_calls)
+    overlay.toolbar.config["lifted"] = False
+    overlay.toolbar.bindings["<Visibility>"](types.SimpleNamespace(state="VisibilityUnobscured"))
+    assert overlay.toolbar.config["lifted"] is False
+
+    overlay.toolbar.bindings["<Visibility>"](types.SimpleNamespace(state="VisibilityPartiallyObscured"))
+    assert overlay.toolbar.config["lifted"] is True
+
+
+def test_quick_overlay_reuses_hidden_toolbar(fresh_import, monkeypatch, fake_widget):
+    overlay_module = load_quick_overlay(fresh_import)
+    display_module = fresh_import("utils.display_manager")
+    monkeypatch.setattr(
+        overlay_module,
+        "get_display_manager",
+        lambda: DisplayManagerStub(display_module.DisplayBounds(left=0, top=0, width=1920, height=1080)),
+    )
+
+    first = overlay_module.QuickOverlay(fake_widget, lambda _rect: None, lambda _rect: None)
+    first._mode_record()
+    first._close()
+
+    assert first.toolbar.exists is True
+    assert first.toolbar.config["withdrawn"] is True
+
+    second = overlay_module.QuickOverlay(fake_widget, lambda _rect: None, lambda _rect: None)
+
+    assert second.toolbar is first.toolbar
+    assert second.toolbar_canvas.bindings["<ButtonPress-1>"] == second._on_toolbar_press
+    assert second.toolbar_canvas.items[second._button_ids["screenshot"]]["config"]["fill"] == overlay_module.NEON_BLUE
+
+
+def test_quick_overlay_resolves_display_affinity_api_once(fresh_import, monkeypatch):
+    overlay_module = load_quick_overlay(fresh_import)
+    lookups = []
+    calls = []
+
+    class Function:
+        def __init__(self, name):
+            self.name = name
+
+        def __call__(self, *args):
+            calls.append((self.name, args))
+            return 456
+
+    class User32:
+        def __getattr__(self, name):
+            lookups.append(name)
+            return Function(name)
+
+    monkeypatch.setattr(ctypes, "windll", types.SimpleNamespace(user32=User32()), raising=False)
+    overlay = types.SimpleNamespace(toolbar=types.SimpleNamespace(winfo_id=lambda: 123))
+
+    assert overlay_module.QuickOverlay._set_exclusion(overlay) is True
+    assert overlay_module.QuickOverlay._set_exclusion(overlay) is True
+
+    assert lookups == ["GetParent", "SetWindowDisplayAffinity"]
+    assert calls[-1] == ("SetWindowDisplayAffinity", (456, overlay_module.WDA_EXCLUDEFROMCAPTURE))
+
+
+def test_quick_overlay_exclusion_reports_refused_window(fresh_import, monkeypatch):
+    overlay_module = load_quick_overlay(fresh_import)
+    affinity_calls = []
+    monkeypatch.setattr(
+        overlay_module,
+        "_display_affinity_api",
+        lambda: (lambda _hwnd: 0, lambda hwnd, value: affinity_calls.append(hwnd) or 0),
+    )
+    overlay = types.SimpleNamespace(toolbar=types.SimpleNamespace(winfo_id=lambda: 123))
+
+    assert overlay_module.QuickOverlay._set_exclusion(overlay) is False
+    assert affinity_calls == [123]
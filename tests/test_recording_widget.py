@@ -0,0 +1,250 @@
+import types
+
+
+def load_recording_widget(fresh_import):
+    return fresh_import("gui.recording_widget")
+
+
+def make_widget(widget_module, fake_widget, elapsed):
+    return widget_module.RecordingWidget(
+        fake_widget,
+        on_stop=lambda: None,
+        on_pause=lambda paused: paused,
+        get_elapsed=lambda: elapsed[0],
+    )
+
+
+def test_update_timer_wakes_when_second_ticks_over(fresh_import, fake_widget):
+    widget_module = load_recording_widget(fresh_import)
+    elapsed = [12.3]
+
+    widget = make_widget(widget_module, fake_widget, elapsed)
+
+    assert widget.time_label.config["text"] == "00:12"
+    assert (705, widget.update_timer) in widget.after_calls
+
+
+def test_update_timer_skips_unchanged_text(fresh_import, fake_widget):
+    widget_module = load_recording_widget(fresh_import)
+    elapsed = [3725.5]
+    widget = make_widget(widget_module, fake_widget, elapsed)
+    assert widget.time_label.config["text"] == "1:02:05"
+
+    widget.time_label.config["text"] = "stale"
+    elapsed[0] = 3725.9
+    widget.update_timer()
+
+    assert widget.time_label.config["text"] == "stale"
+
+
+def test_pause_suspends_timer_and_progress_polls(fresh_import, fake_widget):
+    widget_module = load_recording_widget(fresh_import)
+    elapsed = [5.0]
+    widget = make_widget(widget_module, fake_widget, elapsed)
+    cancelled = []
+    widget.after_cancel = cancelled.append
+    pending = (widget._update_id, widget._progress_id)
+
+    widget.set_paused(True)
+    polls = [callback for _delay, callback in widget.after_calls]
+
+    assert cancelled == list(pending)
+    assert (widget._update_id, widget._progress_id) == (None, None)
+    widget.update_timer()
+    widget.update_progress()
+    assert [callback for _delay, callback in widget.after_calls] == polls
+
+    elapsed[0] = 6.5
+    widget.set_paused(False)
+    assert widget.time_label.config["text"] == "00:06"
+    assert widget.after_calls[-2:] == [(505, widget.update_timer), (500, widget.update_progress)]
+
+
+def test_indicator_blinks_only_while_paused(fresh_import, fake_widget):
+    widget_module = load_recording_widget(fresh_import)
+    widget = make_widget(widget_module, fake_widget, [0.0])
+
+    assert all(callback != widget._animate_indicator for _delay, callback in widget.after_calls)
+
+    widget.set_paused(True)
+    assert widget.after_calls[-1] == (500, widget._animate_indicator)
+    assert widget.rec_indicator.config["text_color"] == "#888888"
+
+    widget.set_paused(False)
+    assert widget._anim_id is None
+    assert widget.config["after_cancelled"]
+    assert widget.rec_indicator.config["text"] == "●"
+    assert widget.rec_indicator.config["text_color"] == "#FF3333"
+
+
+def test_format_elapsed_switches_to_hours(fresh_import):
+    widget_module = load_recording_widget(fresh_import)
+
+    assert widget_module.format_elapsed(59) == "00:59"
+    assert widget_module.format_elapsed(3599) == "59:59"
+    assert widget_module.format_elapsed(3600) == "1:00:00"
+
+
+def test_update_progress_configures_only_changed_labels(fresh_import, fake_widget):
+    widget_module = load_recording_widget(fresh_import)
+    progress = types.SimpleNamespace(fps=60.0, bitrate="6000kbits/s", dropped=0)
+    widget = widget_module.RecordingWidget(
+        fake_widget,
+        on_stop=lambda: None,
+        on_pause=lambda paused: paused,
+        get_progress=lambda: progress,
+    )
+    assert widget.fps_label.config["text"] == "FPS: 60"
+    assert widget.fps_label.config["text_color"] == "#00FF00"
+
+    configured = []
+    for label in (widget.fps_label, widget.bitrate_label, widget.dropped_label):
+        label.configure = lambda label=label, **options: configured.append((label, options))
+
+    widget.update_progress()
+    assert configured == []
+
+    progress.dropped = 3
+    widget.update_progress()
+    assert configured == [(widget.dropped_label, {"text": "Dropped: 3"})]
+
+
+def test_update_progress_restores_fps_after_resume(fresh_import, fake_widget):
+    widget_module = load_recording_widget(fresh_import)
+    progress = types.SimpleNamespace(fps=30.0, bitrate="3000kbits/s", dropped=0)
+    widget = widget_module.RecordingWidget(
+        fake_widget,
+        on_stop=lambda: None,
+        on_pause=lambda paused: paused,
+        get_progress=lambda: progress,
+    )
+
+    widget.set_paused(True)
+    widget.update_progress()
+    assert widget.fps_label.config["text"] == "FPS: PAUSED"
+
+    widget.set_paused(False)
+    widget.update_progress()
+    assert widget.fps_label.config["text"] == "FPS: 30"
+
+
+def test_update_progress_skips_labels_while_minimized(fresh_import, fake_widget):
+    widget_module = load_recording_widget(fresh_import)
+    progress = types.SimpleNamespace(fps=60.0, bitrate="6000kbits/s", dropped=0)
+    widget = widget_module.RecordingWidget(
+        fake_widget,
+        on_stop=lambda: None,
+        on_pause=lambda paused: paused,
+        get_progress=lambda: progress,
+    )
+
+    widget.mapped = False
+    progress.dropped = 2
+    widget.update_progress()
+    assert widget.dropped_label.config["text"] == ""
+    assert widget.after_calls[-1] == (500, widget.update_progress)
+
+    widget.mapped = True
+    widget.update_progress()
+    assert widget.dropped_label.config["text"] == "Dropped: 2"
+
+
+def test_set_exclusion_targets_root_window(fresh_import, fake_widget, monkeypatch):
+    widget_module = load_recording_widget(fresh_import)
+    calls = []
+
+    def set_display_affinity(hwnd, affinity):
+        calls.append((hwnd, affinity))
+        return hwnd == 42
+
+    monkeypatch.setattr(
+        widget_module,
+        "_capture_exclusion_api",
+        lambda: (lambda hwnd, flags: 42 if flags == widget_module.GA_ROOT else 0, set_display_affinity),
+    )
+
+    widget = make_widget(widget_module, fake_widget, [0.0])
+
+    assert widget.set_exclusion() is True
+    assert calls[-1] == (42, widget_module.WDA_EXCLUDEFROMCAPTURE)
+
+
+def test_set_exclusion_falls_back_to_client_window(fresh_import, fake_widget, monkeypatch):
+    widget_module = load_recording_widget(fresh_import)
+    calls = []
+
+    def set_display_affinity(hwnd, affinity):
+        calls.append(hwnd)
+        return len(calls) == 2
+
+    widget = make_widget(widget_module, fake_widget, [0.0])
+    monkeypatch.setattr(
+        widget_module, "_capture_exclusion_api", lambda: (lambda hwnd, flags: 42, set_display_affinity)
+    )
+
+    assert widget.set_exclusion() is True
+    assert calls == [42, widget.winfo_id()]
+
+
+def test_exclusion_waits_until_window_is_mapped(fresh_import, fake_widget, monkeypatch):
+    widget_module = load_recording_widget(fresh_import)
+    calls = []
+    monkeypatch.setattr(
+        widget_module,
+        "_capture_exclusion_api",
+        lambda: (lambda hwnd, flags: 42, lambda hwnd, affinity: calls.append(hwnd) or True),
+    )
+    widget = make_widget(widget_module, fake_widget, [0.0])
+    widget.mapped = False
+
+    assert calls == []
+    assert ("idle", widget._apply_exclusion) in widget.after_calls
+    widget._apply_exclusion()
+    assert calls == []
+    assert widget.after_calls[-1] == (widget_module.EXCLUSION_RETRY_MS, widget._apply_exclusion)
+
+    widget.mapped = True
+    retries = len(widget.after_calls)
+    widget._apply_exclusion()
+    assert calls == [42]
+    assert len(widget.after_calls) == retries
+    assert widget._exclusion_id is None
+
+
+def test_exclusion_gives_up_after_repeated_refusals(fresh_import, fake_widget, monkeypatch):
+    widget_module = load_recording_widget(fresh_import)
+    calls = []
+    monkeypatch.setattr(
+        widget_module,
+        "_capture_exclusion_api",
+        lambda: (lambda hwnd, flags: 42, lambda hwnd, affinity: calls.append(hwnd) or False),
+    )
+    widget = make_widget(widget_module, fake_widget, [0.0])
+
+    for _ in range(widget_module.EXCLUSION_ATTEMPTS):
+        widget._apply_exclusion()
+
+    assert len(calls) == 2 * widget_module.EXCLUSION_ATTEMPTS
+    assert widget._exclusion_id is None
+
+
+def test_drag_moves_window_once_per_idle_pass(fresh_import, fake_widget):
+    widget_module = load_recording_widget(fresh_import)
+    widget = make_widget(widget_module, fake_widget, [0.0])
+    geometries = []
+    widget.geometry = geometries.append
+
+    widget.start_move(types.SimpleNamespace(x_root=110, y_root=120))
+    widget.do_move(types.SimpleNamespace(x_root=130, y_root=90))
+    widget.do_move(types.SimpleNamespace(x_root=60, y_root=70))
+
+    move_calls = [call for call in widget.after_calls if call[1] == widget._apply_move]
+    assert move_calls == [("idle", widget._apply_move)]
+    assert geometries == []
+
+    widget._apply_move()
+    assert geometries == ["+50+50"]
+
+    widget.do_move(types.SimpleNamespace(x_root=0, y_root=10))
+    widget._apply_move()
+    assert geometries[-1] == "-10-10"
@@ -47,3 +47,276 @@ def test_region_selector_resets_too_small_selection(fresh_import, monkeypatch, f
 
     assert selected == []
     assert selector.start_x is None
+
+
+def test_region_selector_polls_pointer_while_selecting(fresh_import, monkeypatch, fake_widget):
+    selector_module = load_region_selector(fresh_import)
+    display_module = fresh_import("utils.display_manager")
+    monkeypatch.setattr(
+        selector_module,
+        "get_display_manager",
+        lambda: DisplayManagerStub(display_module.DisplayBounds(left=-1280, top=0, width=3200, height=1080)),
+    )
+
+    selector = selector_module.RegionSelector(fake_widget, lambda _rect: None, lock_input=False)
+    assert "<B1-Motion>" not in selector.canvas.bindings
+
+    selector._on_press(types.SimpleNamespace(x=10, y=10))
+    selector.window.pointer = (-1200, 90)
+    selector._poll_pointer()
+
+    polls = [call for call in selector.window.after_calls if call[1] == selector._poll_pointer]
+    assert len(polls) == 2
+    assert selector.canvas.items[selector.rect_id]["coords"] == (10, 10, 80, 90)
+    assert selector.canvas.items[selector.size_label_id]["config"]["text"] == "70 × 80"
+    assert selector.canvas.idle_flushes == 1
+
+    selector._poll_pointer()
+
+    assert selector.canvas.idle_flushes == 1
+
+
+def test_region_selector_skips_redraw_for_unchanged_pointer(fresh_import, monkeypatch, fake_widget):
+    selector_module = load_region_selector(fresh_import)
+    display_module = fresh_import("utils.display_manager")
+    monkeypatch.setattr(
+        selector_module,
+        "get_display_manager",
+        lambda: DisplayManagerStub(display_module.DisplayBounds(left=0, top=0, width=1920, height=1080)),
+    )
+
+    selector = selector_module.RegionSelector(fake_widget, lambda _rect: None, lock_input=False)
+    selector._on_press(types.SimpleNamespace(x=10, y=10))
+    selector._update_selection(80, 90)
+
+    calls = []
+    monkeypatch.setattr(selector.canvas, "coords", lambda *args: calls.append(("coords", args)))
+    monkeypatch.setattr(selector.canvas, "itemconfig", lambda *args, **kwargs: calls.append(("itemconfig", kwargs)))
+    selector._update_selection(80, 90)
+
+    assert calls == []
+
+
+def test_dim_mask_leaves_selection_undimmed(fresh_import):
+    selector_module = load_region_selector(fresh_import)
+    canvas = selector_module.tk.Canvas()
+
+    mask = selector_module.DimMask(canvas, 1920, 1080)
+    mask.update(100, 200, 300, 400)
+
+    coords = [canvas.items[item_id]["coords"] for item_id in mask._ids]
+    assert coords == [
+        (0, 0, 1920, 200),
+        (0, 400, 1920, 1080),
+        (0, 200, 100, 400),
+        (300, 200, 1920, 400),
+    ]
+
+
+def test_region_selector_reuses_selection_items_between_attempts(fresh_import, monkeypatch, fake_widget):
+    selector_module = load_region_selector(fresh_import)
+    display_module = fresh_import("utils.display_manager")
+    monkeypatch.setattr(
+        selector_module,
+        "get_display_manager",
+        lambda: DisplayManagerStub(display_module.DisplayBounds(left=0, top=0, width=1920, height=1080)),
+    )
+
+    selector = selector_module.RegionSelector(fake_widget, lambda _rect: None, lock_input=False)
+    item_count = len(selector.canvas.items)
+    rect_id = selector.rect_id
+
+    for _attempt in range(3):
+        selector._on_press(types.SimpleNamespace(x=10, y=10))
+        selector._on_release(types.SimpleNamespace(x=12, y=12))
+
+    assert len(selector.canvas.items) == item_count
+    assert selector.rect_id == rect_id
+    assert selector.canvas.items[rect_id]["config"]["state"] == "hidden"
+
+
+def test_region_selector_keeps_size_label_on_screen(fresh_import, monkeypatch, fake_widget):
+    selector_module = load_region_selector(fresh_import)
+    display_module = fresh_import("utils.display_manager")
+    monkeypatch.setattr(
+        selector_module,
+        "get_display_manager",
+        lambda: DisplayManagerStub(display_module.DisplayBounds(left=0, top=0, width=1920, height=1080)),
+    )
+
+    selector = selector_module.RegionSelector(fake_widget, lambda _rect: None, lock_input=False)
+    selector._on_press(types.SimpleNamespace(x=1800, y=5))
+    selector._update_selection(1915, 1075)
+
+    assert selector.canvas.items[selector.size_label_id]["coords"] == (1840, 1050)
+
+
+def test_region_selector_defers_grab_and_focus_until_mapped(fresh_import, monkeypatch, fake_widget):
+    selector_module = load_region_selector(fresh_import)
+    display_module = fresh_import("utils.display_manager")
+    monkeypatch.setattr(
+        selector_module,
+        "get_display_manager",
+        lambda: DisplayManagerStub(display_module.DisplayBounds(left=0, top=0, width=1920, height=1080)),
+    )
+
+    selector = selector_module.RegionSelector(fake_widget, lambda _rect: None, lock_input=True)
+
+    assert "focused" not in selector.window.config
+    assert ("idle", selector._activate) in selector.window.after_calls
+
+    selector.window.mapped = False
+    selector._activate()
+
+    assert (selector_module.FOCUS_RETRY_MS, selector._activate) in selector.window.after_calls
+    assert "grabbed" not in selector.window.config
+
+    selector.window.mapped = True
+    selector._activate()
+
+    assert selector.window.config["grabbed"] is True
+    assert selector.window.config["focused"] is True
+
+
+def test_region_selector_hides_instructions_once(fresh_import, monkeypatch, fake_widget):
+    selector_module = load_region_selector(fresh_import)
+    display_module = fresh_import("utils.display_manager")
+    monkeypatch.setattr(
+        selector_module,
+        "get_display_manager",
+        lambda: DisplayManagerStub(display_module.DisplayBounds(left=0, top=0, width=1920, height=1080)),
+    )
+    selector = selector_module.RegionSelector(fake_widget, lambda _rect: None, lock_input=False)
+    hidden = []
+    original_itemconfig = selector.canvas.itemconfig
+
+    def itemconfig(item, **kwargs):
+        if item == "ui":
+            hidden.append(kwargs)
+        original_itemconfig(item, **kwargs)
+
+    monkeypatch.setattr(selector.canvas, "itemconfig", itemconfig)
+    selector._on_press(types.SimpleNamespace(x=10, y=10))
+    selector._on_release(types.SimpleNamespace(x=12, y=12))
+    selector._on_press(types.SimpleNamespace(x=10, y=10))
+
+    assert hidden == [{"state": "hidden"}]
+    assert selector.canvas.deleted == []
+
+
+def test_grab_virtual_screen_reuses_mss_instance(fresh_import, monkeypatch):
+    selector_module = load_region_selector(fresh_import)
+    created = []
+    decoded = []
+
+    class FakeSct:
+        monitors = [{"left": -1280, "top": 0, "width": 3200, "height": 1080}]
+
+        def __init__(self):
+            created.append(self)
+
+        def grab(self, monitor):
+            return types.SimpleNamespace(size=(monitor["width"], monitor["height"]), bgra=b"raw")
+
+    monkeypatch.setattr(selector_module.mss, "mss", FakeSct)
+    monkeypatch.setattr(selector_module, "_sct", None)
+    monkeypatch.setattr(selector_module.Image, "frombuffer", lambda *args: decoded.append(args) or args)
+    display_module = fresh_import("utils.display_manager")
+    monkeypatch.setattr(
+        selector_module,
+        "get_display_manager",
+        lambda: DisplayManagerStub(display_module.DisplayBounds(left=-1280, top=0, width=3200, height=1080)),
+    )
+
+    selector_module.grab_virtual_screen()
+    selector_module.grab_virtual_screen()
+
+    assert len(created) == 1
+    assert decoded[0] == ("RGB", (3200, 1080), b"raw", "raw", "BGRX", 0, 1)
+
+
+def test_grab_virtual_screen_follows_changed_virtual_bounds(fresh_import, monkeypatch):
+    selector_module = load_region_selector(fresh_import)
+    display_module = fresh_import("utils.display_manager")
+    grabbed = []
+
+    class FakeSct:
+        # Cached at first use and never refreshed, like mss
+        monitors = [{"left": 0, "top": 0, "width": 1920, "height": 1080}]
+
+        def grab(self, monitor):
+            grabbed.append(dict(monitor))
+            return types.SimpleNamespace(size=(monitor["width"], monitor["height"]), bgra=b"raw")
+
+    display = DisplayManagerStub(display_module.DisplayBounds(left=0, top=0, width=1920, height=1080))
+    monkeypatch.setattr(selector_module.mss, "mss", FakeSct)
+    monkeypatch.setattr(selector_module, "_sct", None)
+    monkeypatch.setattr(selector_module, "get_display_manager", lambda: display)
+    monkeypatch.setattr(selector_module.Image, "frombuffer", lambda *args: args)
+
+    selector_module.grab_virtual_screen()
+    display.bounds = display_module.DisplayBounds(left=-2560, top=-360, width=4480, height=1440)
+    image = selector_module.grab_virtual_screen()
+
+    assert grabbed == [
+        {"left": 0, "top": 0, "width": 1920, "height": 1080},
+        {"left": -2560, "top": -360, "width": 4480, "height": 1440},
+    ]
+    assert image[1] == (4480, 1440)
+
+
+def test_background_photo_reuses_tk_photo_for_same_size(fresh_import, monkeypatch):
+    selector_module = load_region_selector(fresh_import)
+    created = []
+
+    class FakePhoto:
+        def __init__(self, image):
+            self.pasted = [image]
+            created.append(self)
+
+        def paste(self, image):
+            self.pasted.append(image)
+
+    monkeypatch.setattr(selector_module.ImageTk, "PhotoImage", FakePhoto)
+    monkeypatch.setattr(selector_module, "_bg_photo", None)
+    first = types.SimpleNamespace(size=(1920, 1080), mode="RGB")
+    second = types.SimpleNamespace(size=(1920, 1080), mode="RGB")
+
+    photo = selector_module.background_photo(first)
+    assert selector_module.background_photo(second) is photo
+    assert photo.pasted == [first, second]
+
+    resized = selector_module.background_photo(types.SimpleNamespace(size=(2560, 1440), mode="RGB"))
+    assert resized is not photo
+    assert len(created) == 2
+
+
+def test_region_selector_turns_translucent_without_screenshot(fresh_import, monkeypatch, fake_widget):
+    selector_module = load_region_selector(fresh_import)
+    display_module = fresh_import("utils.display_manager")
+    monkeypatch.setattr(
+        selector_module,
+        "get_display_manager",
+        lambda: DisplayManagerStub(display_module.DisplayBounds(left=0, top=0, width=1920, height=1080)),
+    )
+
+    def fail():
+        raise OSError("capture unavailable")
+
+    monkeypatch.setattr(selector_module, "grab_virtual_screen", fail)
+
+    selector = selector_module.RegionSelector(fake_widget, lambda _rect: None, lock_input=False)
+
+    assert selector.bg_image is None
+    assert ("-alpha", selector_module.FALLBACK_ALPHA) in selector.window.config["attributes"]
+
+
+def test_background_photo_uploads_rgb(fresh_import, monkeypatch, fake_image):
+    selector_module = load_region_selector(fresh_import)
+    monkeypatch.setattr(selector_module, "_bg_photo", None)
+    fake_image.mode = "RGBA"
+
+    photo = selector_module.background_photo(fake_image)
+
+    assert fake_image.converted == "RGB"
+    assert photo.image.mode == "RGB"
@@ -0,0 +1,48 @@
+import types
+
+
+def load_tray(fresh_import):
+    return fresh_import("gui.tray")
+
+
+def test_load_tray_icon_decodes_file_once(fresh_import, monkeypatch, tmp_path):
+    tray = load_tray(fresh_import)
+    icon_path = tmp_path / "rec.png"
+    icon_path.write_bytes(b"png")
+    opened = []
+    from PIL import Image
+
+    original_open = Image.open
+    monkeypatch.setattr(tray, "ICONS_DIR", str(tmp_path))
+    monkeypatch.setattr(
+        Image, "open", lambda path: opened.append(path) or original_open(path)
+    )
+
+    first = tray.load_tray_icon()
+    second = tray.load_tray_icon()
+
+    assert first is second
+    assert opened == [str(icon_path)]
+
+
+def test_load_tray_icon_reuses_fallback(fresh_import, monkeypatch, tmp_path):
+    tray = load_tray(fresh_import)
+    monkeypatch.setattr(tray, "ICONS_DIR", str(tmp_path))
+
+    assert tray.load_tray_icon() is tray.load_tray_icon()
+    assert tray.load_tray_icon("missing.png", fallback=False) is None
+
+
+def test_update_icon_swaps_in_cached_rgba_image(fresh_import, monkeypatch, tmp_path):
+    tray = load_tray(fresh_import)
+    (tmp_path / "stop.png").write_bytes(b"png")
+    monkeypatch.setattr(tray, "ICONS_DIR", str(tmp_path))
+    system_tray = tray.SystemTray(lambda: None, lambda: None, lambda: None)
+    system_tray._icon = types.SimpleNamespace(icon=None)
+
+    system_tray.update_icon("stop.png")
+    first = system_tray._icon.icon
+    system_tray.update_icon("stop.png")
+
+    assert first.mode == "RGBA"
+    assert system_tray._icon.icon is first
@@ -60,3 +60,27 @@ def test_scene_preview_render_draws_multiple_layers(fresh_import, fake_widget):
     preview.render(scene)
 
     assert len(preview.canvas.items) >= 7
+
+
+def test_vu_meter_draws_integer_level_width(fresh_import, fake_widget):
+    _models, widgets = load_modules(fresh_import)
+    meter = widgets.VUMeter(fake_widget, width=290, height=10)
+
+    meter.set_level(0.333)
+
+    level_bar = meter.canvas.items[max(meter.canvas.items)]
+    assert level_bar["coords"] == (0, 0, 96, 10)
+
+
+def test_vu_meter_reuses_level_bar(fresh_import, fake_widget):
+    _models, widgets = load_modules(fresh_import)
+    meter = widgets.VUMeter(fake_widget, width=200, height=10)
+    item_count = len(meter.canvas.items)
+
+    meter.set_level(0.5)
+    meter.canvas.coords(meter.level_bar, -1)
+    meter.set_level(0.502)
+
+    assert len(meter.canvas.items) == item_count
+    assert meter.canvas.deleted == []
+    assert meter.canvas.items[meter.level_bar]["coords"] == (-1,)
@@ -6,17 +6,20 @@ FFmpeg Handler v1.4.0 for NeoRecorder.
 - Safe mode fallback for unstable hardware encoders
 """
 
+import ctypes
 import subprocess
 import os
+import json
 import time
 import threading
-import queue
 import re
 import tempfile
 import platform
+from collections import deque
 from typing import Optional, Dict, Callable, List
 from dataclasses import dataclass
-from config import FFMPEG_PATH, QUALITY_PRESETS, USE_HARDWARE_ENCODER
+from functools import lru_cache
+from config import ENCODER_CACHE_FILE, FFMPEG_PATH, QUALITY_PRESETS, USE_HARDWARE_ENCODER
 from utils.logger import get_logger, log_ffmpeg_output, log_error, log_debug
 
 if platform.system() == "Windows":
@@ -24,6 +27,23 @@ if platform.system() == "Windows":
 else:
     CREATION_FLAGS = 0
 
+# Write buffer for the per-recording FFmpeg log
+LOG_BUFFER_SIZE = 64 * 1024
+# Recent stderr lines kept for get_output_lines; older ones are dropped
+OUTPUT_HISTORY_SIZE = 500
+# Seconds between log flushes while FFmpeg runs, so a crash loses little of the log
+LOG_FLUSH_INTERVAL = 2.0
+
+# No banner and no stderr status line: progress arrives as key=value blocks on stdout,
+# leaving stderr to stream info, warnings and errors
+MONITOR_ARGS = ("-hide_banner", "-nostats", "-progress", "pipe:1")
+
+# Probe output parsers, compiled once
+# "Video: bmp, bgra, 5120x1440, ..." in the gdigrab probe
+GDIGRAB_SIZE_RE = re.compile(r'Video:.*,\s+(\d+)x(\d+)[,\s]')
+# '[dshow @ ...]  "Microphone (Realtek)"' in the device list
+DSHOW_NAME_RE = re.compile(r'"([^"]+)"')
+
 ENCODER_PRIORITY = ("h264_nvenc", "h264_qsv", "h264_amf")
 ENCODER_LIMITS = {
     "h264_nvenc": {"max_width": None, "max_fps": 240},
@@ -32,6 +52,88 @@ ENCODER_LIMITS = {
 }
 
 
+@lru_cache(maxsize=1)
+def _dpi_aware_user32():
+    """user32, after making the process DPI aware once so metrics are in physical pixels"""
+    try:
+        ctypes.windll.shcore.SetProcessDpiAwareness(2)
+    except Exception:
+        try:
+            ctypes.windll.user32.SetProcessDPIAware()
+        except Exception:
+            pass
+    return ctypes.windll.user32
+
+
+# Encodings FFmpeg's console output shows up in on Windows, in the order they are tried
+OUTPUT_ENCODINGS = ("utf-8", "cp1251", "cp866")
+
+
+def decode_output_line(line: bytes) -> str:
+    """Decode one line of FFmpeg output; pure ASCII (progress lines) takes a single pass"""
+    if line.isascii():
+        return line.decode("ascii")
+    for encoding in OUTPUT_ENCODINGS:
+        try:
+            return line.decode(encoding)
+        except UnicodeDecodeError:
+            continue
+    return line.decode("utf-8", errors="ignore")
+
+
+def _parse_encoder_names(output: str) -> set:
+    """Video encoder names from `ffmpeg -encoders` (lines like " V....D h264_nvenc  NVIDIA ...")"""
+    names = set()
+    in_table = False
+    for line in output.splitlines():
+        # The flag legend above the "------" separator is not an encoder list
+        if not in_table:
+            in_table = line.strip().startswith("---")
+            continue
+        fields = line.split(None, 2)
+        if len(fields) >= 2 and line.startswith(" V"):
+            names.add(fields[1])
+    return names
+
+
+def _read_encoder_cache(ffmpeg_mtime: int) -> Optional[List[str]]:
+    """Encoders listed by this FFmpeg build last time, if the cache matches it"""
+    try:
+        with open(ENCODER_CACHE_FILE, "r", encoding="utf-8") as f:
+            cache = json.load(f)
+        if cache["ffmpeg_path"] == FFMPEG_PATH and cache["ffmpeg_mtime"] == ffmpeg_mtime:
+            return list(cache["encoders"])
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+    return None
+
+
+def _write_encoder_cache(ffmpeg_mtime: int, encoders: List[str]):
+    """Store the encoder list atomically so a torn write is never read back"""
+    temp_path = f"{ENCODER_CACHE_FILE}.tmp"
+    try:
+        os.makedirs(os.path.dirname(ENCODER_CACHE_FILE), exist_ok=True)
+        with open(temp_path, "w", encoding="utf-8") as f:
+            json.dump({"ffmpeg_path": FFMPEG_PATH, "ffmpeg_mtime": ffmpeg_mtime, "encoders": encoders}, f)
+        os.replace(temp_path, ENCODER_CACHE_FILE)
+    except OSError as e:
+        log_debug(f"Encoder cache not saved: {e}")
+
+
+def _amf_video_args(quality) -> List[str]:
+    amf_qp = str(max(12, quality["crf"]))
+    return ["-usage", "lowlatency", "-rc", "cqp", "-qp_i", amf_qp, "-qp_p", amf_qp, "-quality", "speed"]
+
+
+# Encoder-specific output flags over a quality preset, looked up instead of branching per start
+ENCODER_ARG_BUILDERS: Dict[str, Callable[[Dict], List[str]]] = {
+    "libx264": lambda quality: ["-preset", quality["preset"], "-tune", "zerolatency", "-crf", str(quality["crf"])],
+    "h264_nvenc": lambda quality: ["-preset", "p4", "-tune", "ll", "-rc", "vbr", "-cq", str(quality["crf"] + 5), "-b:v", "0"],
+    "h264_qsv": lambda quality: ["-preset", "faster", "-global_quality", str(quality["crf"] + 5)],
+    "h264_amf": _amf_video_args,
+}
+
+
 @dataclass
 class RecordingProgress:
     """Progress data from FFmpeg output"""
@@ -44,6 +146,34 @@ class RecordingProgress:
     dropped: int = 0
 
 
+def _progress_number(values: Dict[bytes, bytes], key: bytes, cast, default):
+    try:
+        return cast(values[key])
+    except (KeyError, ValueError):
+        return default
+
+
+def _progress_text(values: Dict[bytes, bytes], key: bytes, default: str) -> str:
+    value = values.get(key, b"").strip()
+    if not value or value == b"N/A":
+        return default
+    return value.decode("ascii", errors="replace")
+
+
+def parse_progress_block(values: Dict[bytes, bytes]) -> RecordingProgress:
+    """Snapshot from one `-progress` block (frame=19, fps=59.00, ..., ending with progress=continue)"""
+    total_size = _progress_number(values, b"total_size", int, 0)
+    return RecordingProgress(
+        frame=_progress_number(values, b"frame", int, 0),
+        fps=_progress_number(values, b"fps", float, 0.0),
+        bitrate=_progress_text(values, b"bitrate", "0kbits/s"),
+        size=f"{total_size // 1024}KiB",
+        time=_progress_text(values, b"out_time", "00:00:00.00"),
+        speed=_progress_text(values, b"speed", "N/A"),
+        dropped=_progress_number(values, b"drop_frames", int, 0),
+    )
+
+
 @dataclass(frozen=True)
 class EncoderDecision:
     """Resolved capture and encoder profile."""
@@ -55,12 +185,16 @@ class EncoderDecision:
 
 
 class FFmpegHandler:
+    # Tested encoder list, shared by every handler in the process
+    _shared_encoders: Optional[List[str]] = None
+
     def __init__(self):
         self.process: Optional[subprocess.Popen] = None
         self.current_output: Optional[str] = None
         self.current_encoder: Optional[str] = None
         self.start_timestamp: Optional[float] = None
         self._available_encoders: Optional[list] = None
+        self._best_encoder: Optional[str] = None
         
         # Segment-based pause
         self._segments: List[str] = []
@@ -86,7 +220,7 @@ class FFmpegHandler:
         self._on_progress: Optional[Callable[[RecordingProgress], None]] = None
         
         # Progress monitoring
-        self._output_queue: queue.Queue = queue.Queue()
+        self._output_queue: deque = deque(maxlen=OUTPUT_HISTORY_SIZE)
         self._last_progress: RecordingProgress = RecordingProgress()
         self._log_file = None
         self._safe_mode_active = False
@@ -107,37 +241,55 @@ class FFmpegHandler:
         """Detect available hardware encoders (cached) with actual test"""
         if self._available_encoders is not None:
             return self._available_encoders
+        if FFmpegHandler._shared_encoders is not None:
+            self._available_encoders = list(FFmpegHandler._shared_encoders)
+            return self._available_encoders
         
         self._available_encoders = []
         
         # First get list of encoders from FFmpeg
-        try:
-            result = subprocess.run(
-                [FFMPEG_PATH, "-encoders", "-hide_banner"],
-                capture_output=True, text=True, timeout=10,
-                creationflags=CREATION_FLAGS
-            )
-            output = result.stdout
-        except Exception as e:
-            print(f"Error detecting encoders: {e}")
+        hw_encoders = self._list_hardware_encoders()
+        if hw_encoders is None:
             return self._available_encoders
         
         # Test each hardware encoder with an actual encoding attempt
-        hw_encoders = []
-        if "h264_nvenc" in output:
-            hw_encoders.append("h264_nvenc")
-        if "h264_qsv" in output:
-            hw_encoders.append("h264_qsv")
-        if "h264_amf" in output:
-            hw_encoders.append("h264_amf")
-        
         for encoder in hw_encoders:
             if self._test_encoder(encoder):
                 self._available_encoders.append(encoder)
                 print(f"Hardware encoder available: {encoder}")
         
+        FFmpegHandler._shared_encoders = list(self._available_encoders)
         return self._available_encoders
     
+    def _list_hardware_encoders(self) -> Optional[List[str]]:
+        """Hardware encoders built into FFmpeg; `ffmpeg -encoders` runs once per FFmpeg build"""
+        try:
+            ffmpeg_mtime = os.stat(FFMPEG_PATH).st_mtime_ns
+        except OSError:
+            ffmpeg_mtime = None
+        if ffmpeg_mtime is not None:
+            cached = _read_encoder_cache(ffmpeg_mtime)
+            if cached is not None:
+                return cached
+        
+        try:
+            # Only stdout is parsed: drop stderr and decode the (ASCII) table once
+            result = subprocess.run(
+                [FFMPEG_PATH, "-encoders", "-hide_banner"],
+                stdin=subprocess.DEVNULL, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, timeout=10,
+                creationflags=CREATION_FLAGS
+            )
+            output = result.stdout.decode("ascii", "ignore")
+        except Exception as e:
+            print(f"Error detecting encoders: {e}")
+            return None
+        
+        names = _parse_encoder_names(output)
+        hw_encoders = [encoder for encoder in ENCODER_PRIORITY if encoder in names]
+        if ffmpeg_mtime is not None:
+            _write_encoder_cache(ffmpeg_mtime, hw_encoders)
+        return hw_encoders
+    
     def _test_encoder(self, encoder: str) -> bool:
         """Test if encoder actually works with real screen capture"""
         try:
@@ -155,6 +307,7 @@ class FFmpegHandler:
             ]
             result = subprocess.run(
                 cmd,
+                stdin=subprocess.DEVNULL,
                 capture_output=True,
                 timeout=10,
                 creationflags=CREATION_FLAGS
@@ -167,7 +320,10 @@ class FFmpegHandler:
         """Get the best available encoder (prefer hardware)"""
         if self._safe_mode_active or not USE_HARDWARE_ENCODER:
             return "libx264"
-        return self._encoder_candidates(0, 60)[0]
+        # Resolved once per handler rather than on every segment start
+        if self._best_encoder is None:
+            self._best_encoder = self._encoder_candidates(0, 60)[0]
+        return self._best_encoder
 
     def start_recording(self, output_path: str, rect=None, mic=None, system=False,
                        scene_plan=None,
@@ -201,7 +357,7 @@ class FFmpegHandler:
             "quality_preset": quality_preset
         }
         
-        self.start_timestamp = time.time()
+        self.start_timestamp = time.monotonic()
         
         # Start first segment
         success = self._start_segment()
@@ -269,14 +425,14 @@ class FFmpegHandler:
             cmd = [FFMPEG_PATH, "-f", "gdigrab", "-i", "desktop", "-t", "0.1", "-f", "null", "-"]
             result = subprocess.run(
                 cmd, 
+                stdin=subprocess.DEVNULL,
                 capture_output=True, 
                 text=True, 
                 encoding='utf-8', 
                 errors='ignore',
                 creationflags=CREATION_FLAGS
             )
-            # Look for: Video: bmp, bgra, 5120x1440, ...
-            match = re.search(r'Video:.*,\s+(\d+)x(\d+)[,\s]', result.stderr)
+            match = GDIGRAB_SIZE_RE.search(result.stderr)
             if match:
                 return int(match.group(1)), int(match.group(2))
         except Exception as e:
@@ -296,7 +452,8 @@ class FFmpegHandler:
         probe_resolution=True,
     ) -> bool:
         """Build and execute FFmpeg command with proper resource management"""
-        quality = QUALITY_PRESETS.get(quality_preset, QUALITY_PRESETS["balanced"])
+        # The fallback preset is only looked up when the requested one is unknown
+        quality = QUALITY_PRESETS.get(quality_preset) or QUALITY_PRESETS["balanced"]
         decision = self._build_encoder_decision(input_format, rect, framerate, probe_resolution)
         tried_hardware = False
 
@@ -368,15 +525,7 @@ class FFmpegHandler:
     @staticmethod
     def _system_width() -> int:
         try:
-            import ctypes
-            try:
-                ctypes.windll.shcore.SetProcessDpiAwareness(2)
-            except Exception:
-                try:
-                    ctypes.windll.user32.SetProcessDPIAware()
-                except Exception:
-                    pass
-            return ctypes.windll.user32.GetSystemMetrics(0)
+            return _dpi_aware_user32().GetSystemMetrics(0)
         except Exception:
             return 0
 
@@ -424,17 +573,18 @@ class FFmpegHandler:
         safe_mode=False,
     ):
         capture_rects = self._capture_rects(rect, scene_plan)
-        cmd = [FFMPEG_PATH, "-y"]
-        cmd.extend(self._video_input_args(input_format, framerate, capture_rects))
         audio_index = len(capture_rects)
-        if mic:
-            cmd.extend(["-f", "dshow", "-i", f"audio={mic}"])
-        cmd.extend(self._filter_args(scene_plan, capture_rects, mic is not None, audio_index))
-        cmd.extend(["-c:v", encoder])
+        mic_args = ["-f", "dshow", "-i", f"audio={mic}"] if mic else []
         selected_quality = QUALITY_PRESETS["ultrafast"] if safe_mode and encoder == "libx264" else quality
-        cmd.extend(self._video_args(encoder, selected_quality))
-        cmd.extend(["-pix_fmt", "yuv420p", "-vsync", "cfr", output_path])
-        return cmd
+        return [
+            FFMPEG_PATH, "-y", *MONITOR_ARGS,
+            *self._video_input_args(input_format, framerate, capture_rects),
+            *mic_args,
+            *self._filter_args(scene_plan, capture_rects, mic is not None, audio_index),
+            "-c:v", encoder,
+            *self._video_args(encoder, selected_quality),
+            "-pix_fmt", "yuv420p", "-vsync", "cfr", output_path,
+        ]
 
     @staticmethod
     def _capture_rects(rect, scene_plan):
@@ -541,15 +691,7 @@ class FFmpegHandler:
 
     @staticmethod
     def _video_args(encoder, quality):
-        if encoder == "libx264":
-            return ["-preset", quality["preset"], "-tune", "zerolatency", "-crf", str(quality["crf"])]
-        if encoder == "h264_nvenc":
-            return ["-preset", "p4", "-tune", "ll", "-rc", "vbr", "-cq", str(quality["crf"] + 5), "-b:v", "0"]
-        if encoder == "h264_qsv":
-            return ["-preset", "faster", "-global_quality", str(quality["crf"] + 5)]
-
-        amf_qp = max(12, quality["crf"])
-        return ["-usage", "lowlatency", "-rc", "cqp", "-qp_i", str(amf_qp), "-qp_p", str(amf_qp), "-quality", "speed"]
+        return ENCODER_ARG_BUILDERS.get(encoder, _amf_video_args)(quality)
 
     def _launch_ffmpeg(self, cmd, output_path, encoder, framerate, safe_framerate, quality_preset, capture_width):
         self._open_log_file(output_path, encoder, framerate, safe_framerate, quality_preset, capture_width, cmd)
@@ -557,6 +699,7 @@ class FFmpegHandler:
             self.process = subprocess.Popen(
                 cmd,
                 stdin=subprocess.PIPE,
+                # -progress writes its key=value blocks here
                 stdout=subprocess.PIPE,
                 stderr=subprocess.PIPE,
                 creationflags=CREATION_FLAGS,
@@ -577,106 +720,94 @@ class FFmpegHandler:
 
     def _open_log_file(self, output_path, encoder, framerate, safe_framerate, quality_preset, capture_width, cmd):
         log_path = output_path + ".log"
+        header = (
+            f"Encoder: {encoder}\n"
+            f"FPS: {framerate}\n"
+            f"Safe FPS: {safe_framerate}\n"
+            f"Capture Width: {capture_width}\n"
+            f"Quality: {quality_preset}\n"
+            f"Command: {' '.join(cmd)}\n\n"
+        )
         try:
-            self._log_file = open(log_path, "w", encoding="utf-8")
-            self._log_file.write(f"Encoder: {encoder}\n")
-            self._log_file.write(f"FPS: {framerate}\n")
-            self._log_file.write(f"Safe FPS: {safe_framerate}\n")
-            self._log_file.write(f"Capture Width: {capture_width}\n")
-            self._log_file.write(f"Quality: {quality_preset}\n")
-            self._log_file.write(f"Command: {' '.join(cmd)}\n\n")
-            self._log_file.flush()
+            # The header and FFmpeg's output share one large buffer, flushed by the
+            # stderr drain every few seconds and on close
+            self._log_file = open(log_path, "wb", buffering=LOG_BUFFER_SIZE)
+            self._log_file.write(header.encode("utf-8"))
         except Exception as e:
             print(f"Failed to create log file: {e}")
             self._log_file = None
 
     def _start_output_monitor(self):
-        """Start thread to monitor FFmpeg output and parse progress"""
-        def monitor():
-            # Updated regex to handle FFmpeg's padded output format
-            # Example: frame=   19 fps=0.0 q=-0.0 size=       0KiB time=00:00:00.63 bitrate=   0.6kbits/s speed=1.25x
-            progress_pattern = re.compile(
-                r'frame=\s*(\d+)\s+fps=\s*([\d.]+)\s+.*?size=\s*(\S+)\s+'
-                r'time=(\S+)\s+bitrate=\s*([\d.]+\S*)'
-            )
-            speed_pattern = re.compile(r'speed=\s*([\d.]+x)')
-            dropped_pattern = re.compile(r'drop\s*=\s*(\d+)', re.IGNORECASE)
-            
-            while self.process and self.process.poll() is None:
+        """Start threads reading FFmpeg's -progress stream and draining its stderr into the log"""
+        process = self.process
+        if process is None:
+            return
+
+        def drain_stderr():
+            # With -nostats stderr only carries stream info, warnings and errors
+            last_flush = time.monotonic()
+            for line in iter(process.stderr.readline, b""):
                 try:
-                    line = self.process.stderr.readline()
-                    if not line:
-                        continue
-                    
-                    # Try multiple encodings
-                    for enc in ['utf-8', 'cp1251', 'cp866']:
-                        try:
-                            line_str = line.decode(enc).strip()
-                            break
-                        except UnicodeDecodeError:
-                            continue
-                    else:
-                        line_str = line.decode('utf-8', errors='ignore').strip()
+                    line_str = decode_output_line(line).strip()
                     
                     if not line_str:
                         continue
                     
-                    # Log to file
-                    if self._log_file:
+                    # Log to file; buffered, flushed every few seconds rather than per line
+                    log_file = self._log_file
+                    if log_file:
                         try:
-                            self._log_file.write(line_str + "\n")
-                            self._log_file.flush()
+                            log_file.write(line_str.encode("utf-8") + b"\n")
+                            now = time.monotonic()
+                            if now - last_flush >= LOG_FLUSH_INTERVAL:
+                                log_file.flush()
+                                last_flush = now
                         except:
                             pass
                     
-                    # Parse progress
-                    match = progress_pattern.search(line_str)
-                    if match:
-                        speed = "N/A"
-                        speed_match = speed_pattern.search(line_str)
-                        if speed_match:
-                            speed = speed_match.group(1)
-
-                        self._last_progress = RecordingProgress(
-                            frame=int(match.group(1)),
-                            fps=float(match.group(2)),
-                            size=match.group(3),
-                            time=match.group(4),
-                            bitrate=match.group(5),
-                            speed=speed
-                        )
-                        
-                        # Check for dropped frames
-                        drop_match = dropped_pattern.search(line_str)
-                        if drop_match:
-                            self._last_progress.dropped = int(drop_match.group(1))
-                        
-                        # Call progress callback
-                        if self._on_progress:
-                            self._on_progress(self._last_progress)
-                    
-                    # Put in queue for external access
-                    self._output_queue.put(line_str)
+                    # Keep for external access; the bounded deque drops the oldest lines
+                    self._output_queue.append(line_str)
                     
                 except Exception as e:
-                    print(f"Monitor error: {e}")
+                    print(f"Stderr drain error: {e}")
                     break
-            
-            # Process ended - check for errors
-            if self.process:
-                returncode = self.process.returncode
-                if returncode is not None and returncode != 0 and not self._is_paused:
-                    # Read remaining stderr
+
+        def monitor():
+            values = {}
+            # readline() blocks until FFmpeg writes; b"" means stdout closed because FFmpeg is exiting
+            for line in iter(process.stdout.readline, b""):
+                key, sep, value = line.rstrip().partition(b"=")
+                if not sep:
+                    continue
+                if key != b"progress":
+                    values[key] = value
+                    continue
+                
+                # "progress=continue" (or "end") closes a block: publish a complete
+                # snapshot in one assignment so readers never see a half-built one
+                self._last_progress = parse_progress_block(values)
+                values = {}
+                
+                # Call progress callback
+                if self._on_progress:
                     try:
-                        remaining = self.process.stderr.read()
-                        if remaining and self._log_file:
-                            self._log_file.write(remaining.decode('utf-8', errors='ignore'))
-                    except:
-                        pass
-                    
+                        self._on_progress(self._last_progress)
+                    except Exception as e:
+                        print(f"Monitor error: {e}")
+            
+            # Sleep on the process handle until FFmpeg exits instead of polling for it
+            returncode = process.wait()
+            # Let the error text reach the log before reporting
+            stderr_thread.join(timeout=1)
+            
+            # Process ended - check for errors (unless it was already replaced or released)
+            if self.process is process:
+                if returncode != 0 and not self._is_paused:
                     if self._on_error:
                         self._on_error(f"FFmpeg exited with code {returncode}")
         
+        stderr_thread = threading.Thread(target=drain_stderr, daemon=True)
+        stderr_thread.start()
         self._monitor_thread = threading.Thread(target=monitor, daemon=True)
         self._monitor_thread.start()
 
@@ -690,8 +821,7 @@ class FFmpegHandler:
         
         # Stop current segment gracefully
         try:
-            self.process.stdin.write(b"q")
-            self.process.stdin.flush()
+            self._request_quit(self.process)
             self.process.wait(timeout=5)
         except Exception as e:
             print(f"Error stopping segment: {e}")
@@ -705,7 +835,7 @@ class FFmpegHandler:
         self.process = None
         
         self._is_paused = True
-        self._pause_start = time.time()
+        self._pause_start = time.monotonic()
         print(f"Recording paused (segment {self._segment_index - 1} saved)")
         return True
 
@@ -720,7 +850,7 @@ class FFmpegHandler:
         success = self._start_segment()
         if success:
             if self._pause_start:
-                self._total_pause_duration += time.time() - self._pause_start
+                self._total_pause_duration += time.monotonic() - self._pause_start
                 self._pause_start = None
             print(f"Recording resumed (new segment {self._segment_index - 1})")
         else:
@@ -745,17 +875,21 @@ class FFmpegHandler:
         """Check if recording is paused"""
         return self._is_paused
 
+    @staticmethod
+    def _request_quit(process):
+        """Ask FFmpeg to finalize the file: a single raw write of "q" to its stdin pipe"""
+        os.write(process.stdin.fileno(), b"q")
+
     def stop_recording(self) -> Dict:
         """Stop recording and merge all segments"""
         duration = 0
         if self.start_timestamp:
-            duration = time.time() - self.start_timestamp - self._total_pause_duration
+            duration = time.monotonic() - self.start_timestamp - self._total_pause_duration
         
         # If paused, no need to stop process (already stopped)
         if not self._is_paused and self.process:
             try:
-                self.process.stdin.write(b"q")
-                self.process.stdin.flush()
+                self._request_quit(self.process)
                 self.process.wait(timeout=10)
             except Exception:
                 try:
@@ -826,26 +960,31 @@ class FFmpegHandler:
                 return existing_segments[0]
         
         # Multiple segments - use ffmpeg concat
-        concat_file = os.path.join(self._temp_dir, "concat_list.txt")
         try:
-            with open(concat_file, "w", encoding="utf-8") as f:
-                for segment in existing_segments:
-                    # Escape single quotes in path
-                    safe_path = segment.replace("'", "'\\''")
-                    f.write(f"file '{safe_path}'\n")
+            # Escape single quotes in paths
+            concat_list = "".join(
+                "file '%s'\n" % segment.replace("'", "'\\''") for segment in existing_segments
+            )
             
-            # Run concat
+            # Run concat; the list is fed on stdin instead of through a temp file.
+            # Each segment's timestamps start from its own zero: regenerate missing
+            # PTS and shift the joined stream so stream copy never sees negative ones
             cmd = [
                 FFMPEG_PATH, "-y",
                 "-f", "concat",
                 "-safe", "0",
-                "-i", concat_file,
+                # Entries of a list read from a pipe may only be opened with whitelisted protocols
+                "-protocol_whitelist", "file,pipe",
+                "-fflags", "+genpts",
+                "-i", "pipe:0",
                 "-c", "copy",
+                "-avoid_negative_ts", "make_zero",
                 self._final_output
             ]
             
             result = subprocess.run(
                 cmd,
+                input=concat_list.encode("utf-8"),
                 capture_output=True,
                 creationflags=CREATION_FLAGS,
                 timeout=300
@@ -889,10 +1028,12 @@ class FFmpegHandler:
         if not self.start_timestamp:
             return 0
         
-        elapsed = time.time() - self.start_timestamp - self._total_pause_duration
+        # Monotonic clock: wall-clock adjustments must not jump the timer
+        now = time.monotonic()
+        elapsed = now - self.start_timestamp - self._total_pause_duration
         
         if self._is_paused and self._pause_start:
-            elapsed -= (time.time() - self._pause_start)
+            elapsed -= (now - self._pause_start)
         
         return max(0, elapsed)
 
@@ -903,10 +1044,10 @@ class FFmpegHandler:
     def get_output_lines(self, max_lines: int = 100) -> List[str]:
         """Get recent FFmpeg output lines"""
         lines = []
-        while not self._output_queue.empty() and len(lines) < max_lines:
+        while len(lines) < max_lines:
             try:
-                lines.append(self._output_queue.get_nowait())
-            except queue.Empty:
+                lines.append(self._output_queue.popleft())
+            except IndexError:
                 break
         return lines
 
@@ -919,6 +1060,7 @@ class FFmpegHandler:
             
             result = subprocess.run(
                 cmd, 
+                stdin=subprocess.DEVNULL,
                 capture_output=True, 
                 encoding='utf-8', 
                 errors='ignore',
@@ -940,7 +1082,7 @@ class FFmpegHandler:
                 
                 if is_audio_section and line.strip().startswith('[dshow') and '"' in line:
                     # Extract name in quotes: [dshow @ ...]  "Microphone (Realtek)"
-                    match = re.search(r'"([^"]+)"', line)
+                    match = DSHOW_NAME_RE.search(line)
                     if match:
                         name = match.group(1)
                         # Filter out alternative names and duplicates
@@ -3,20 +3,30 @@ Logger module for NeoRecorder.
 Provides centralized logging with file and console output.
 """
 
+import atexit
 import logging
+import logging.handlers
 import os
+import queue
+import re
 import sys
 from datetime import datetime
 from typing import Dict
 
 # Logger cache by name
 _loggers: Dict[str, logging.Logger] = {}
+# Background writers feeding each logger's file handler
+_listeners: Dict[str, logging.handlers.QueueListener] = {}
+
+# FFmpeg lines worth a warning; matched case-insensitively without lowercasing a copy
+_FFMPEG_ALERT_RE = re.compile(r"error|warning|failed|drop", re.IGNORECASE)
 
 
 def get_logger(name: str = "NeoRecorder") -> logging.Logger:
     """Get or create the application logger"""
-    if name in _loggers:
-        return _loggers[name]
+    logger = _loggers.get(name)
+    if logger is not None:
+        return logger
 
     logger = logging.getLogger(name)
     logger.setLevel(logging.DEBUG)
@@ -46,7 +56,13 @@ def get_logger(name: str = "NeoRecorder") -> logging.Logger:
         datefmt='%Y-%m-%d %H:%M:%S'
     )
     file_handler.setFormatter(file_format)
-    logger.addHandler(file_handler)
+    # The file is written on a listener thread; logging from the FFmpeg monitor
+    # or the UI thread only enqueues the record
+    log_queue = queue.SimpleQueue()
+    logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    listener = logging.handlers.QueueListener(log_queue, file_handler, respect_handler_level=True)
+    listener.start()
+    _listeners[name] = listener
     
     # Console handler (INFO level, only in dev mode)
     if not getattr(sys, 'frozen', False):
@@ -63,6 +79,18 @@ def get_logger(name: str = "NeoRecorder") -> logging.Logger:
     return logger
 
 
+def stop_listeners():
+    """Write out queued records and close the log files"""
+    for listener in _listeners.values():
+        listener.stop()
+        for handler in listener.handlers:
+            handler.close()
+    _listeners.clear()
+
+
+atexit.register(stop_listeners)
+
+
 def log_recording_start(output_path: str, fps: int, quality: str, encoder: str):
     """Log recording start event"""
     logger = get_logger()
@@ -100,7 +128,7 @@ def log_ffmpeg_output(line: str):
     """Log FFmpeg output line"""
     logger = get_logger()
     # Only log important FFmpeg messages
-    if any(kw in line.lower() for kw in ['error', 'warning', 'failed', 'drop']):
+    if _FFMPEG_ALERT_RE.search(line):
         logger.warning(f"FFmpeg: {line}")
     else:
         logger.debug(f"FFmpeg: {line}")
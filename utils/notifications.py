@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import tkinter as tk
 from dataclasses import dataclass
+from types import SimpleNamespace
 from enum import Enum
 from typing import Optional
 
@@ -92,6 +93,11 @@ def toast_line_count(payload: ToastPayload) -> int:
     return 1 + message_lines + footer_lines
 
 
+# Fade keyframes as (alpha, ms until the next frame), built once
+FADE_IN_FRAMES = tuple((round(min(step * 0.12, 0.95), 2), 18) for step in range(9))
+FADE_OUT_FRAMES = tuple((round(max(0.95 - step * 0.12, 0.0), 2), 22) for step in range(9))
+
+
 def show_notification(
     title: str,
     message: str,
@@ -104,31 +110,61 @@ def show_notification(
 
 
 class NeoToast:
-    """Single-instance toast renderer."""
+    """Single-instance toast renderer.
+
+    One hidden Toplevel is built on first use and shown again for every
+    toast; only its texts, colours and geometry change between toasts.
+    """
 
     _active_toast = None
+    _toast_window = None
+    _toast_parts = None
+    _anim_id = None
+    _dismiss_id = None
 
     @classmethod
     def show(cls, payload: ToastPayload):
         """Render a toast from a payload."""
         cls._close_active()
-        root = cls._get_root()
-        toast = cls._create_window(root)
+        toast = cls._acquire_window()
         cls._active_toast = toast
         cls._layout_toast(toast, payload)
-        cls._bind_close(toast)
-        cls._fade_in(toast)
-        toast.after(int(payload.duration * 1000), lambda: cls._fade_out(toast))
+        toast.attributes("-alpha", 0.0)
+        toast.deiconify()
+        toast.lift()
+        cls._start_animation(toast, FADE_IN_FRAMES)
+        cls._dismiss_id = toast.after(int(payload.duration * 1000), cls._dismiss, toast)
 
     @classmethod
     def _close_active(cls):
         if cls._active_toast is None:
             return
-        try:
-            cls._active_toast.destroy()
-        except Exception:
-            pass
-        cls._active_toast = None
+        # A new toast replaces the old one at once, without finishing its fade
+        cls._cancel_timers(cls._active_toast)
+        cls._hide_toast(cls._active_toast)
+
+    @classmethod
+    def _cancel_timers(cls, toast):
+        for name in ("_anim_id", "_dismiss_id"):
+            after_id = getattr(cls, name)
+            if after_id is None:
+                continue
+            try:
+                toast.after_cancel(after_id)
+            except Exception:
+                pass
+            setattr(cls, name, None)
+
+    @classmethod
+    def _acquire_window(cls):
+        toast = cls._toast_window
+        if toast is not None and toast.winfo_exists():
+            return toast
+        toast = cls._create_window(cls._get_root())
+        cls._toast_parts = cls._build_parts(toast)
+        cls._bind_close(toast)
+        cls._toast_window = toast
+        return toast
 
     @staticmethod
     def _get_root():
@@ -142,25 +178,45 @@ class NeoToast:
     @staticmethod
     def _create_window(root):
         toast = tk.Toplevel(root)
+        toast.withdraw()
         toast.overrideredirect(True)
         toast.attributes("-topmost", True)
         toast.attributes("-alpha", 0.0)
         toast.configure(bg="#09131B")
         return toast
 
-    @classmethod
-    def _layout_toast(cls, toast, payload: ToastPayload):
-        scale = cls._dpi_scale(toast)
-        cls._position_toast(toast, payload, scale)
+    @staticmethod
+    def _build_parts(toast):
         frame = tk.Frame(toast, bg="#101B27", highlightbackground="#274459", highlightthickness=1)
         frame.pack(fill="both", expand=True)
-        accent = tk.Frame(frame, bg=payload.accent, width=max(6, int(6 * scale)))
+        accent = tk.Frame(frame)
         accent.pack(side="left", fill="y")
         content = tk.Frame(frame, bg="#101B27")
-        content.pack(fill="both", expand=True, padx=int(16 * scale), pady=int(14 * scale))
-        cls._render_header(content, payload, scale)
-        cls._render_message(content, payload, scale)
-        cls._render_footer(content, payload, scale)
+        row = tk.Frame(content, bg="#101B27")
+        row.pack(fill="x")
+        icon = tk.Label(row, bg="#1B2D3F")
+        title = tk.Label(row, bg="#101B27", anchor="w")
+        message = tk.Label(content, bg="#101B27", justify="left", anchor="w")
+        footer = tk.Label(content, bg="#101B27", anchor="w")
+        return SimpleNamespace(
+            accent=accent,
+            content=content,
+            icon=icon,
+            title=title,
+            message=message,
+            footer=footer,
+        )
+
+    @classmethod
+    def _layout_toast(cls, toast, payload: ToastPayload):
+        scale = cls._dpi_scale(toast)
+        cls._position_toast(toast, payload, scale)
+        parts = cls._toast_parts
+        parts.accent.configure(bg=payload.accent, width=max(6, int(6 * scale)))
+        parts.content.pack(fill="both", expand=True, padx=int(16 * scale), pady=int(14 * scale))
+        cls._render_header(parts, payload, scale)
+        cls._render_message(parts, payload, scale)
+        cls._render_footer(parts, payload, scale)
 
     @staticmethod
     def _dpi_scale(toast) -> float:
@@ -177,61 +233,48 @@ class NeoToast:
         toast.geometry(f"{width}x{height}{_axis(x)}{_axis(y)}")
 
     @staticmethod
-    def _render_header(content, payload: ToastPayload, scale: float):
-        row = tk.Frame(content, bg="#101B27")
-        row.pack(fill="x")
-        icon = tk.Label(
-            row,
+    def _render_header(parts, payload: ToastPayload, scale: float):
+        parts.icon.configure(
             text=payload.icon,
             font=("Bahnschrift SemiBold", max(11, int(11 * scale)), "bold"),
-            bg="#1B2D3F",
             fg=payload.accent,
             padx=int(10 * scale),
             pady=int(5 * scale),
         )
-        icon.pack(side="left", padx=(0, int(12 * scale)))
-        title = tk.Label(
-            row,
+        parts.icon.pack(side="left", padx=(0, int(12 * scale)))
+        parts.title.configure(
             text=payload.title,
             font=("Bahnschrift SemiCondensed", max(15, int(15 * scale)), "bold"),
-            bg="#101B27",
             fg=payload.title_color,
-            anchor="w",
         )
-        title.pack(fill="x")
+        parts.title.pack(fill="x")
 
     @staticmethod
-    def _render_message(content, payload: ToastPayload, scale: float):
-        message = tk.Label(
-            content,
+    def _render_message(parts, payload: ToastPayload, scale: float):
+        parts.message.configure(
             text=payload.message,
             font=("Segoe UI", max(10, int(10 * scale))),
-            bg="#101B27",
             fg=payload.body_color,
-            justify="left",
-            anchor="w",
             wraplength=int(280 * scale),
         )
-        message.pack(fill="x", pady=(int(10 * scale), 0))
+        parts.message.pack(fill="x", pady=(int(10 * scale), 0))
 
     @staticmethod
-    def _render_footer(content, payload: ToastPayload, scale: float):
+    def _render_footer(parts, payload: ToastPayload, scale: float):
         if not payload.footer:
+            parts.footer.pack_forget()
             return
-        footer = tk.Label(
-            content,
+        parts.footer.configure(
             text=payload.footer.upper(),
             font=("Consolas", max(9, int(9 * scale))),
-            bg="#101B27",
             fg=payload.footer_color,
-            anchor="w",
         )
-        footer.pack(fill="x", pady=(int(10 * scale), 0))
+        parts.footer.pack(fill="x", pady=(int(10 * scale), 0))
 
     @classmethod
     def _bind_close(cls, toast):
         def close(_event=None):
-            cls._fade_out(toast, start=0.95)
+            cls._dismiss(toast)
 
         cls._bind_tree(toast, close)
 
@@ -242,30 +285,43 @@ class NeoToast:
             cls._bind_tree(child, handler)
 
     @classmethod
-    def _fade_in(cls, toast, alpha: float = 0.0):
+    def _dismiss(cls, toast):
+        """Fade the toast out and hide it for reuse."""
+        cls._cancel_timers(toast)
+        cls._start_animation(toast, FADE_OUT_FRAMES, on_done=cls._hide_toast)
+
+    @classmethod
+    def _hide_toast(cls, toast):
         try:
-            if not toast.winfo_exists():
-                return
-            if alpha >= 0.95:
-                toast.attributes("-alpha", 0.95)
-                return
-            toast.attributes("-alpha", alpha)
-            toast.after(18, lambda: cls._fade_in(toast, alpha + 0.12))
+            toast.withdraw()
         except Exception:
             pass
+        if cls._active_toast is toast:
+            cls._active_toast = None
+
+    @classmethod
+    def _start_animation(cls, toast, frames, on_done=None):
+        """Run one fade at a time: a new fade replaces the running one."""
+        if cls._anim_id is not None:
+            try:
+                toast.after_cancel(cls._anim_id)
+            except Exception:
+                pass
+        cls._animate(toast, frames, on_done, 0)
 
     @classmethod
-    def _fade_out(cls, toast, start: float = 0.95):
+    def _animate(cls, toast, frames, on_done, index):
+        cls._anim_id = None
         try:
             if not toast.winfo_exists():
                 return
-            if start <= 0.0:
-                toast.destroy()
-                if cls._active_toast is toast:
-                    cls._active_toast = None
+            if index == len(frames):
+                if on_done:
+                    on_done(toast)
                 return
-            toast.attributes("-alpha", start)
-            toast.after(22, lambda: cls._fade_out(toast, start - 0.12))
+            alpha, delay = frames[index]
+            toast.attributes("-alpha", alpha)
+            cls._anim_id = toast.after(delay, cls._animate, toast, frames, on_done, index + 1)
         except Exception:
             pass
 
@@ -4,15 +4,134 @@ Reusable component for selecting screen regions with dimming and visual feedback
 """
 
 import tkinter as tk
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import lru_cache
 from typing import Callable, Optional, Tuple
-from PIL import ImageGrab, ImageTk, ImageEnhance
+import mss
+from PIL import Image, ImageGrab, ImageTk
 from utils.display_manager import get_display_manager
 
+# Selection follows the pointer at roughly one redraw per display frame (~60 Hz)
+POINTER_POLL_MS = 16
+
+# Delay between focus attempts while the overlay is not mapped yet
+FOCUS_RETRY_MS = 10
+
+# Room kept for the size label at the right/bottom screen edges
+SIZE_LABEL_MARGIN = (80, 30)
+
+# Outside-selection dimming: half of the pixels painted black
+DIM_FILL = "black"
+DIM_STIPPLE = "gray50"
+
+# Without a screenshot the overlay turns translucent so the live desktop shows through
+FALLBACK_ALPHA = 0.5
+
+
+# Shared capture instance, so its GDI device context and DIB are created once per process
+_sct = None
+
+# Captures run on one worker thread, which also owns the mss instance
+_capture_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="overlay-capture")
+
+
+def grab_virtual_screen():
+    """Capture the whole virtual desktop (all monitors) as an RGB image"""
+    return grab_virtual_screen_async().result()
+
+
+def grab_virtual_screen_async() -> Future:
+    """Start a virtual desktop capture off the UI thread, the future resolves to an RGB image"""
+    return _capture_executor.submit(_grab_virtual_screen)
+
+
+def _grab_virtual_screen():
+    global _sct
+    try:
+        if _sct is None:
+            _sct = mss.mss()
+        # The shared instance caches its monitor list; ask for the current virtual
+        # desktop so the image matches the overlay after a layout or DPI change
+        bounds = get_display_manager().get_virtual_bounds()
+        raw = _sct.grab(bounds.to_mss_box())
+        # Decode BGRA straight from the capture buffer, no intermediate copy
+        return Image.frombuffer("RGB", raw.size, raw.bgra, "raw", "BGRX", 0, 1)
+    except Exception as e:
+        print(f"mss capture failed, falling back to ImageGrab: {e}")
+    try:
+        return ImageGrab.grab(all_screens=True)
+    except TypeError:
+        return ImageGrab.grab()
+
+
+# Tk photo reused across overlay openings: (image size, PhotoImage)
+_bg_photo = None
+
+
+def background_photo(image):
+    """
+    Return a PhotoImage showing image.
+    The previous Tk photo is refilled in place when the screen size is unchanged,
+    so reopening an overlay does not allocate a new full-screen photo.
+    """
+    global _bg_photo
+    # Upload 3 bytes per pixel, the overlay background never needs alpha
+    if image.mode != "RGB":
+        image = image.convert("RGB")
+    if _bg_photo is not None and _bg_photo[0] == image.size:
+        photo = _bg_photo[1]
+        photo.paste(image)
+        return photo
+    photo = ImageTk.PhotoImage(image)
+    _bg_photo = (image.size, photo)
+    return photo
+
+
+@lru_cache(maxsize=512)
+def format_size_label(width: int, height: int) -> str:
+    """Selection size readout, memoized across drag frames"""
+    return f"{width} × {height}"
+
+
+class DimMask:
+    """
+    Dims everything outside the selection with four stippled rectangles.
+    Only rectangle coords change while dragging; the screenshot is never re-rendered.
+    """
+    
+    def __init__(self, canvas, width: int, height: int):
+        self.canvas = canvas
+        self.width = width
+        self.height = height
+        self._ids = tuple(
+            canvas.create_rectangle(
+                0, 0, 0, 0,
+                fill=DIM_FILL,
+                stipple=DIM_STIPPLE,
+                outline="",
+                tags="dim"
+            )
+            for _ in range(4)
+        )
+        self.clear()
+    
+    def clear(self):
+        """Dim the whole screen (no selection)"""
+        self.update(0, 0, 0, 0)
+    
+    def update(self, x1: int, y1: int, x2: int, y2: int):
+        """Leave the normalized box (x1, y1)-(x2, y2) undimmed"""
+        top, bottom, left, right = self._ids
+        self.canvas.coords(top, 0, 0, self.width, y1)
+        self.canvas.coords(bottom, 0, y2, self.width, self.height)
+        self.canvas.coords(left, 0, y1, x1, y2)
+        self.canvas.coords(right, x2, y1, self.width, y2)
+
 
 class RegionSelector:
     """
     Fullscreen overlay for selecting a screen region.
-    Shows dimmed screenshot background with visual feedback.
+    Shows screenshot background, dimmed outside the selection, with visual feedback.
     
     Usage:
         def on_selected(rect):
@@ -64,10 +183,7 @@ class RegionSelector:
         self.screenshot = None
         self.bg_image = None
         try:
-            self.screenshot = self._grab_background()
-            if dim_screen:
-                enhancer = ImageEnhance.Brightness(self.screenshot)
-                self.screenshot = enhancer.enhance(0.4)  # 40% brightness
+            self.screenshot = grab_virtual_screen()
         except Exception as e:
             print(f"Screenshot grab failed: {e}")
         
@@ -91,10 +207,16 @@ class RegionSelector:
         
         # Background image
         if self.screenshot:
-            self.bg_image = ImageTk.PhotoImage(self.screenshot)
+            self.bg_image = background_photo(self.screenshot)
             self.canvas.create_image(0, 0, anchor="nw", image=self.bg_image, tags="bg")
+        else:
+            self.window.attributes("-alpha", FALLBACK_ALPHA)
+        
+        # Dimming outside the selection
+        self.dim_mask = DimMask(self.canvas, self.screen_width, self.screen_height) if dim_screen else None
         
-        # Instructions
+        # Instructions (canvas items, hidden on first press)
+        self._instructions_visible = show_instructions
         if show_instructions:
             self.instructions_id = self.canvas.create_text(
                 self.screen_width // 2, 50,
@@ -120,64 +242,120 @@ class RegionSelector:
         self.start_y = None
         self.rect_id = None
         self.size_label_id = None
+        self._create_selection_items()
+        self._poll_id = None
+        self._last_cur = None
+        self._last_wh = None
+        self._last_label_pos = None
         
         # Bindings
         self.canvas.bind("<ButtonPress-1>", self._on_press)
-        self.canvas.bind("<B1-Motion>", self._on_drag)
         self.canvas.bind("<ButtonRelease-1>", self._on_release)
-        self.window.bind("<Escape>", lambda e: self._cancel())
+        self.window.bind("<Escape>", self._on_escape)
         
-        # Lock input
-        if lock_input:
-            self.window.grab_set()
-        
-        self.window.focus_force()
+        # Lock input and take focus once the window is mapped
+        self._lock_input = lock_input
         self.window.lift()
+        self.window.after_idle(self._activate)
 
-    @staticmethod
-    def _grab_background():
+    def _activate(self):
+        """Grab input and focus after the overlay is mapped, so ESC works without a click"""
+        if self._closed:
+            return
         try:
-            return ImageGrab.grab(all_screens=True)
-        except TypeError:
-            return ImageGrab.grab()
+            if not self.window.winfo_ismapped():
+                self.window.after(FOCUS_RETRY_MS, self._activate)
+                return
+            if self._lock_input:
+                self.window.grab_set()
+            self.window.focus_force()
+        except tk.TclError:
+            pass
 
-    def _on_press(self, event):
-        """Mouse pressed - start selection"""
-        self.start_x = event.x
-        self.start_y = event.y
-        
-        # Hide instructions
-        self.canvas.delete("ui")
-        
-        # Create rectangle
+    def _create_selection_items(self):
+        """Create the selection rectangle and size label once, hidden until a press"""
         self.rect_id = self.canvas.create_rectangle(
-            self.start_x, self.start_y,
-            self.start_x, self.start_y,
+            0, 0, 0, 0,
             outline="#00F2FF",
             width=2,
+            state="hidden",
             tags="selection"
         )
-        
-        # Size label
         self.size_label_id = self.canvas.create_text(
-            self.start_x + 10, self.start_y - 20,
-            text="0 × 0",
+            0, 0,
+            text=format_size_label(0, 0),
             fill="#00F2FF",
             font=("Consolas", 12),
             anchor="nw",
+            state="hidden",
             tags="selection"
         )
     
-    def _on_drag(self, event):
-        """Mouse drag - update selection"""
-        if self.start_x is None:
+    def _hide_selection(self):
+        """Hide selection items so they can be reused by the next press"""
+        self.canvas.itemconfig(self.rect_id, state="hidden")
+        self.canvas.itemconfig(self.size_label_id, state="hidden")
+    
+    def _on_press(self, event):
+        """Mouse pressed - start selection"""
+        self.start_x = event.x
+        self.start_y = event.y
+        
+        # Hide instructions once; later presses skip the canvas call
+        if self._instructions_visible:
+            self._instructions_visible = False
+            self.canvas.itemconfig("ui", state="hidden")
+        
+        # Show the pre-created selection items at the press point
+        self.canvas.coords(self.rect_id, self.start_x, self.start_y, self.start_x, self.start_y)
+        self.canvas.coords(self.size_label_id, self.start_x + 10, self.start_y - 20)
+        self.canvas.itemconfig(self.rect_id, state="normal")
+        self.canvas.itemconfig(self.size_label_id, text=format_size_label(0, 0), state="normal")
+        self._last_cur = (self.start_x, self.start_y)
+        self._last_wh = (0, 0)
+        self._last_label_pos = (self.start_x + 10, self.start_y - 20)
+        self._schedule_poll()
+    
+    def _schedule_poll(self):
+        """Schedule the next pointer poll"""
+        self._cancel_poll()
+        self._poll_id = self.window.after(POINTER_POLL_MS, self._poll_pointer)
+    
+    def _poll_pointer(self):
+        """Follow the pointer at a fixed cadence while selecting"""
+        self._poll_id = None
+        if self._closed or self.start_x is None:
             return
         
-        cur_x = event.x
-        cur_y = event.y
+        pointer_x, pointer_y = self.window.winfo_pointerxy()
+        if self._update_selection(pointer_x - self.screen_left, pointer_y - self.screen_top):
+            # Flush this tick's item changes as a single repaint
+            self.canvas.update_idletasks()
+        self._schedule_poll()
+    
+    def _cancel_poll(self):
+        """Stop following the pointer"""
+        if self._poll_id is not None:
+            try:
+                self.window.after_cancel(self._poll_id)
+            except tk.TclError:
+                pass
+            self._poll_id = None
+    
+    def _update_selection(self, cur_x, cur_y):
+        """Redraw selection rectangle and size label, returns True if anything changed"""
+        # Skip duplicate pointer positions
+        if (cur_x, cur_y) == self._last_cur:
+            return False
+        self._last_cur = (cur_x, cur_y)
         
         # Update rectangle
         self.canvas.coords(self.rect_id, self.start_x, self.start_y, cur_x, cur_y)
+        if self.dim_mask:
+            self.dim_mask.update(
+                min(cur_x, self.start_x), min(cur_y, self.start_y),
+                max(cur_x, self.start_x), max(cur_y, self.start_y)
+            )
         
         # Calculate size
         w = abs(cur_x - self.start_x)
@@ -188,15 +366,24 @@ class RegionSelector:
         label_y = min(cur_y, self.start_y) - 25
         if label_y < 10:
             label_y = max(cur_y, self.start_y) + 10
+        # Keep the label on screen near the right/bottom edges
+        label_x = min(label_x, self.screen_width - SIZE_LABEL_MARGIN[0])
+        label_y = min(label_y, self.screen_height - SIZE_LABEL_MARGIN[1])
         
-        self.canvas.coords(self.size_label_id, label_x, label_y)
-        self.canvas.itemconfig(self.size_label_id, text=f"{w} × {h}")
+        if (label_x, label_y) != self._last_label_pos:
+            self._last_label_pos = (label_x, label_y)
+            self.canvas.coords(self.size_label_id, label_x, label_y)
+        if (w, h) != self._last_wh:
+            self._last_wh = (w, h)
+            self.canvas.itemconfig(self.size_label_id, text=format_size_label(w, h))
+        return True
     
     def _on_release(self, event):
         """Mouse released - finish selection"""
         if self._closed or self.start_x is None:
             return
         
+        self._cancel_poll()
         end_x = event.x
         end_y = event.y
         
@@ -211,13 +398,23 @@ class RegionSelector:
             self._closed = True
             rect = self._to_absolute_rect(x1, y1, x2, y2)
             self._cleanup()
+            self._flush_master()
             self.on_select(rect)
         else:
             # Too small - reset for new selection
-            self.canvas.delete("selection")
+            self._hide_selection()
+            if self.dim_mask:
+                self.dim_mask.clear()
             self.start_x = None
             self.start_y = None
 
+    def _flush_master(self):
+        """Let Tk unmap the destroyed overlay before the capture callback runs"""
+        try:
+            self.master.update_idletasks()
+        except tk.TclError:
+            pass
+
     def _to_absolute_rect(self, x1, y1, x2, y2):
         return (
             x1 + self.screen_left,
@@ -226,6 +423,10 @@ class RegionSelector:
             y2 + self.screen_top,
         )
     
+    def _on_escape(self, _event=None):
+        """ESC pressed - cancel selection"""
+        self._cancel()
+    
     def _cancel(self):
         """Cancel selection"""
         if self._closed:
@@ -237,13 +438,14 @@ class RegionSelector:
     
     def _cleanup(self):
         """Clean up window"""
+        self._cancel_poll()
         try:
             self.window.grab_release()
-        except:
+        except tk.TclError:
             pass
         try:
             self.window.destroy()
-        except:
+        except tk.TclError:
             pass
     
     def destroy(self):